@@ -1,15 +1,11 @@
 from __future__ import annotations
 
+import functools
 import os
 import json
 from pathlib import Path
 import re
 import typer
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.text import Text
-from rich.theme import Theme
 
 from bpm.core import agent_config
 from bpm.core import agent_provider
@@ -30,15 +26,23 @@ app = typer.Typer(
         "Configure and run a BPM/BRS-scoped assistant for template discovery and guidance."
     ),
 )
-_console = Console(
-    theme=Theme(
-        {
-            "markdown.strong": "bold bright_yellow",
-            "markdown.code": "bold cyan",
-            "markdown.code_block": "cyan",
-        }
+
+
+@functools.lru_cache(maxsize=1)
+def _console():
+    """Themed console for chat output, built on first use (not at import)."""
+    from rich.console import Console
+    from rich.theme import Theme
+
+    return Console(
+        theme=Theme(
+            {
+                "markdown.strong": "bold bright_yellow",
+                "markdown.code": "bold cyan",
+                "markdown.code_block": "cyan",
+            }
+        )
     )
-)
 
 
 def _render_template_context() -> str:
@@ -246,6 +250,9 @@ def _trim_history(messages: list[dict[str, str]], max_messages: int = 20) -> lis
 
 
 def _print_chat_header(provider: str, model: str) -> None:
+    from rich.panel import Panel
+    from rich.text import Text
+
     title = Text("BPM Agent Chat", style="bold cyan")
     body = (
         f"Provider: [bold]{provider}[/bold]\n"
@@ -256,22 +263,34 @@ def _print_chat_header(provider: str, model: str) -> None:
         "  [bold]/recommend X[/bold]  Recommend templates for query X\n"
         "  [bold]exit[/bold] or [bold]quit[/bold]  End session"
     )
-    _console.print(Panel.fit(body, title=title, border_style="cyan"))
+    _console().print(Panel.fit(body, title=title, border_style="cyan"))
 
 
 def _print_agent_message(reply: str) -> None:
+    # rich.markdown pulls in markdown-it and pygments; only load it once an
+    # agent reply actually needs rendering.
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
     rendered = Markdown(reply, code_theme="monokai", hyperlinks=False)
-    _console.print(Panel(rendered, title="agent", border_style="green"))
+    _console().print(Panel(rendered, title="agent", border_style="green"))
 
 
 def _print_user_message(text: str) -> None:
-    _console.print(f"[bold cyan]you>[/bold cyan] {text}")
+    from rich.text import Text
+
+    # Style via Text spans: user input is never parsed as rich markup
+    _console().print(Text.assemble(("you>", "bold cyan"), " ", text))
 
 
 def _handle_chat_command(user_text: str) -> str | None:
+    # rich renderables are imported lazily, like the console (chat-only paths)
+    from rich.panel import Panel
+    from rich.text import Text
+
     t = user_text.strip()
     if t == "/help":
-        _console.print(
+        _console().print(
             Panel.fit(
                 "Commands:\n"
                 "  /help\n"
@@ -287,25 +306,27 @@ def _handle_chat_command(user_text: str) -> str | None:
         try:
             entries = agent_template_index.list_templates()
         except Exception as e:
-            _console.print(f"[red]template lookup failed:[/red] {e}")
+            _console().print(Text.assemble(("template lookup failed:", "red"), f" {e}"))
             return "handled"
         if not entries:
-            _console.print("No active templates.")
+            _console().print("No active templates.", markup=False)
             return "handled"
         preview = "\n".join([f"- {e.template_id}" for e in entries[:30]])
-        _console.print(Panel(preview, title="Templates", border_style="blue"))
+        _console().print(Panel(Text(preview), title="Templates", border_style="blue"))
         return "handled"
     if t.startswith("/recommend "):
         query = t[len("/recommend ") :].strip()
         recs = agent_recommend.recommend(goal=query, top_k=3)
         if not recs:
-            _console.print("No matches.")
+            _console().print("No matches.", markup=False)
             return "handled"
         lines = []
         for r in recs:
             conf = "high" if r.score >= 3 else ("medium" if r.score == 2 else "low")
             lines.append(f"- {r.template_id} ({conf}): {r.reason}")
-        _console.print(Panel("\n".join(lines), title=f"Recommendations: {query}", border_style="blue"))
+        _console().print(
+            Panel(Text("\n".join(lines)), title=Text(f"Recommendations: {query}"), border_style="blue")
+        )
         return "handled"
     return None
 
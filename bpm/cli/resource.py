@@ -342,9 +342,8 @@ def update_cmd(
         try:
             if needs or force:
                 before = cache_ver
-                reg.update(sid, force=force, check=False)
-                # Read after-update version from cache
-                after, _, _ = reg.probe_update(sid)
+                # update() returns the record refreshed from the cache repo.yaml
+                after = reg.update(sid, force=force, check=False).version
                 typer.secho(f"[ok] Updated: {sid} {before} -> {after}", fg=typer.colors.GREEN)
             else:
                 # Still refresh metadata/timestamps
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import os
 from pathlib import Path
 import typer
 
@@ -6,6 +7,7 @@ from bpm.core import template_service as svc
 from bpm.core import brs_loader
 from bpm.core.descriptor_loader import load as load_desc
 from bpm.core.project_io import find_project_dir, project_file_path
+from bpm.io.exec import which
 
 app = typer.Typer(
     no_args_is_help=True,
@@ -21,8 +23,8 @@ app = typer.Typer(
 # Dynamic completion for template ids
 def _complete_template_ids(ctx, incomplete: str):
     try:
-        p = brs_loader.get_paths().templates_dir
-        ids = [d.name for d in p.iterdir() if d.is_dir()]
+        with os.scandir(brs_loader.get_paths().templates_dir) as it:
+            ids = [e.name for e in it if e.is_dir()]
     except Exception:
         ids = []
     return [i for i in ids if i.startswith(incomplete)]
@@ -86,9 +88,7 @@ def render(
     # Example: if a param declares cli: "--bcl", users can pass "--bcl /path" or "--bcl=/path".
     # Bool params: "--flag" -> true, "--no-flag" -> false.
     def _parse_template_flags(extra_args: list[str]) -> list[str]:
-        try:
-            desc = load_desc(template_id)
-        except Exception:
+        if desc is None:
             return []
         # Build flag map
         flag_map = {}
@@ -152,14 +152,8 @@ def render(
         return [f"{k}={v}" for k, v in out_params.items()]
 
     # Best-effort environment/tools availability warning (non-fatal)
-    def _warn_missing_tools(tpl_id: str) -> None:
-        try:
-            desc = load_desc(tpl_id)
-        except Exception:
-            return
-        try:
-            from shutil import which
-        except Exception:
+    def _warn_missing_tools() -> None:
+        if desc is None:
             return
         missing_req = [t for t in (desc.tools_required or []) if which(t) is None]
         missing_opt = [t for t in (desc.tools_optional or []) if which(t) is None]
@@ -176,12 +170,19 @@ def render(
                 fg=typer.colors.YELLOW,
             )
 
+    # Load the descriptor once for flag mapping, tool warnings and rendering.
+    # Failures are left to svc.render, which reports them properly.
+    try:
+        desc = load_desc(template_id)
+    except Exception:
+        desc = None
+
     try:
         # Merge explicit --param with mapped template flags
         extra_params = _parse_template_flags(list(ctx.args or []))
         merged_params = (param or []) + extra_params
         # Emit non-fatal warnings about missing tools up-front
-        _warn_missing_tools(template_id)
+        _warn_missing_tools()
         plan = svc.render(
             effective_project_dir,
             template_id,
@@ -190,6 +191,7 @@ def render(
             dry=dry,
             adhoc_out=out.resolve() if out else None,
             adhoc=adhoc,
+            desc=desc,
         )
     except Exception as e:
         # Provide a helpful hint for ad-hoc rendering when project.yaml is missing
@@ -512,10 +514,12 @@ def list_templates(
         typer.secho(f"Error: {e}", err=True, fg=typer.colors.RED)
         raise typer.Exit(code=1)
 
+    # Every output format needs all items, so this list stays eager.
     items = []
     if tdir.exists():
-        for d in sorted([p for p in tdir.iterdir() if p.is_dir()]):
-            tid = d.name
+        with os.scandir(tdir) as it:
+            ids = sorted(e.name for e in it if e.is_dir())
+        for tid in ids:
             try:
                 desc = load_desc(tid)
                 items.append({"id": desc.id, "description": desc.description or ""})
@@ -1,10 +1,11 @@
 from __future__ import annotations
+import os
 from pathlib import Path
-from shutil import which
 import typer
 
 from bpm.core import workflow_service as svc
 from bpm.core import brs_loader
+from bpm.io.exec import which
 
 app = typer.Typer(
     no_args_is_help=True,
@@ -20,17 +21,15 @@ app = typer.Typer(
 # Dynamic completion for workflow ids
 def _complete_workflow_ids(ctx, incomplete: str):
     try:
-        p = brs_loader.get_paths().workflows_dir
-        ids = [d.name for d in p.iterdir() if d.is_dir()]
+        with os.scandir(brs_loader.get_paths().workflows_dir) as it:
+            ids = [e.name for e in it if e.is_dir()]
     except Exception:
         ids = []
     return [i for i in ids if i.startswith(incomplete)]
 
 
-def _warn_missing_tools(workflow_id: str) -> None:
-    try:
-        desc = svc.load_descriptor(workflow_id)
-    except Exception:
+def _warn_missing_tools(desc: svc.WorkflowDescriptor | None) -> None:
+    if desc is None:
         return
     missing_req = [t for t in (desc.tools_required or []) if which(t) is None]
     missing_opt = [t for t in (desc.tools_optional or []) if which(t) is None]
@@ -64,9 +63,7 @@ def run(
     Execute the workflow's entry script.
     """
     def _parse_workflow_flags(extra_args: list[str]) -> list[str]:
-        try:
-            desc = svc.load_descriptor(workflow_id)
-        except Exception:
+        if desc is None:
             return []
         flag_map = {}
         for k, ps in (desc.params or {}).items():
@@ -117,6 +114,12 @@ def run(
             i += 1
         return [f"{k}={v}" for k, v in out_params.items()]
 
+    # Load the descriptor once for flag mapping, tool warnings and the run itself
+    try:
+        desc = svc.load_descriptor(workflow_id)
+    except Exception:
+        desc = None
+
     try:
         if project and project_dir:
             raise ValueError("Use either --project or --dir, not both.")
@@ -124,8 +127,8 @@ def run(
         if project_path is None and project_dir is not None:
             project_path = (project_dir / "project.yaml").resolve()
         merged_params = _parse_workflow_flags(list(ctx.args or []))
-        _warn_missing_tools(workflow_id)
-        svc.run(workflow_id, project_path=project_path, params_kv=merged_params)
+        _warn_missing_tools(desc)
+        svc.run(workflow_id, project_path=project_path, params_kv=merged_params, desc=desc)
     except Exception as e:
         typer.secho(f"Error: {e}", err=True, fg=typer.colors.RED)
         raise typer.Exit(code=1)
@@ -305,8 +308,9 @@ def list_workflows(
 
     items = []
     if wdir.exists():
-        for d in sorted([p for p in wdir.iterdir() if p.is_dir()]):
-            wid = d.name
+        with os.scandir(wdir) as it:
+            ids = sorted(e.name for e in it if e.is_dir())
+        for wid in ids:
             try:
                 desc = svc.load_descriptor(wid)
                 items.append({"id": desc.id, "description": desc.description or ""})
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from bpm.core.agent_template_index import list_templates
+from bpm.core.agent_template_index import iter_templates
 from bpm.core.descriptor_loader import load as load_desc
 
 
@@ -40,7 +40,7 @@ def recommend_from_intent(intent: Intent, top_k: int = 3) -> list[Recommendation
     tokens = [t for t in q.replace("_", " ").replace("-", " ").split() if t]
 
     recs: list[Recommendation] = []
-    for entry in list_templates():
+    for entry in iter_templates():
         try:
             desc = load_desc(entry.template_id)
             description = (desc.description or "").lower()
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterator, Optional
 
 from bpm.core import brs_loader
+from bpm.core.brs_loader import TEMPLATE_DESCRIPTOR_NAMES
 
 
 @dataclass(frozen=True)
@@ -12,14 +15,30 @@ class TemplateEntry:
     descriptor_path: Path
 
 
+def _descriptor_name(template_dir: str) -> Optional[str]:
+    """Pick the descriptor file in template_dir from one listing (no per-name stat)."""
+    try:
+        with os.scandir(template_dir) as it:
+            found = {e.name for e in it if e.name in TEMPLATE_DESCRIPTOR_NAMES and e.is_file()}
+    except OSError:
+        return None
+    for name in TEMPLATE_DESCRIPTOR_NAMES:
+        if name in found:
+            return name
+    return None
+
+
+def iter_templates() -> Iterator[TemplateEntry]:
+    """Yield templates with a descriptor in id order, probing folders lazily."""
+    templates_dir = brs_loader.get_paths().templates_dir
+    # DirEntry.is_dir() uses the type from readdir, so no stat per entry.
+    with os.scandir(templates_dir) as it:
+        dirs = sorted((e.name, e.path) for e in it if e.is_dir())
+    for name, path in dirs:
+        desc = _descriptor_name(path)
+        if desc is not None:
+            yield TemplateEntry(template_id=name, descriptor_path=templates_dir / name / desc)
+
+
 def list_templates() -> list[TemplateEntry]:
-    root = brs_loader.get_paths().templates_dir
-    out: list[TemplateEntry] = []
-    for p in sorted(root.iterdir()):
-        if not p.is_dir():
-            continue
-        desc = brs_loader.template_descriptor_path(p.name)
-        if not desc.exists():
-            continue
-        out.append(TemplateEntry(template_id=p.name, descriptor_path=desc))
-    return out
+    return list(iter_templates())
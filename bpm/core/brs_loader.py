@@ -1,12 +1,19 @@
 from __future__ import annotations
+import functools
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from bpm.core import env
+from bpm.io.fs import file_stamp
 from bpm.io.yamlio import safe_load_yaml
 
 
+# Template descriptor file names, in order of preference (preferred, legacy).
+TEMPLATE_DESCRIPTOR_NAMES = ("template_config.yaml", "template.config.yaml")
+
+
 @dataclass(frozen=True)
 class BrsPaths:
     root: Path
@@ -25,15 +32,36 @@ class BrsConfig:
     settings: Dict[str, Any]
 
 
-def get_active_brs_path() -> Path:
-    """Return the active BRS cache path (raises if none active)."""
+# Last resolved active BRS path, keyed by stores.yaml path and its
+# (mtime_ns, size, inode); stores.yaml is replaced atomically on save.
+_active_memo: Optional[Tuple[Tuple[str, Tuple[int, int, int]], Path]] = None
+
+
+def _resolve_active_cache_path() -> Path:
     idx = env.load_store_index()
     if not idx.active:
         raise RuntimeError("No active BRS. Use `bpm resource activate <id>` first.")
     rec = idx.stores.get(idx.active)
     if not rec:
         raise RuntimeError(f"Active BRS '{idx.active}' not found in stores.yaml.")
-    p = Path(rec.cache_path)
+    return Path(rec.cache_path)
+
+
+def get_active_brs_path() -> Path:
+    """Return the active BRS cache path (raises if none active)."""
+    global _active_memo
+    stores_yaml = env.get_stores_yaml_path()
+    try:
+        key = (str(stores_yaml), file_stamp(stores_yaml))
+    except OSError:
+        key = None
+    if key is not None and _active_memo is not None and _active_memo[0] == key:
+        p = _active_memo[1]
+    else:
+        p = _resolve_active_cache_path()
+        if key is not None:
+            _active_memo = (key, p)
+    # Checked on every call: the cache dir can vanish without touching stores.yaml
     if not p.exists():
         raise RuntimeError(f"Active BRS path does not exist: {p}")
     return p
@@ -41,7 +69,12 @@ def get_active_brs_path() -> Path:
 
 def get_paths(root: Optional[Path] = None) -> BrsPaths:
     """Return standard folders in the BRS (flat layout)."""
-    root = root or get_active_brs_path()
+    return _paths_for(root or get_active_brs_path())
+
+
+@functools.lru_cache(maxsize=32)
+def _paths_for(root: Path) -> BrsPaths:
+    # BrsPaths is frozen, so one instance per root can be shared safely.
     return BrsPaths(
         root=root,
         config_dir=root / "config",
@@ -62,32 +95,54 @@ def load_repo_meta(root: Optional[Path] = None) -> Dict[str, Any]:
     return meta
 
 
-def _load_if_exists(path: Path) -> Dict[str, Any]:
-    return safe_load_yaml(path) if path.exists() else {}
+_CONFIG_FILES = ("authors.yaml", "hosts.yaml", "settings.yaml")
+
+
+def _existing_config_files(config_dir: Path) -> set[str]:
+    """Names of the known config files present in config_dir (one directory scan)."""
+    try:
+        with os.scandir(config_dir) as it:
+            return {e.name for e in it if e.name in _CONFIG_FILES and e.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
 
 
 def load_config(root: Optional[Path] = None) -> BrsConfig:
     """Load config/authors.yaml, hosts.yaml, settings.yaml (missing files -> {})."""
     paths = get_paths(root)
     repo = load_repo_meta(paths.root)
-    authors = _load_if_exists(paths.config_dir / "authors.yaml")
-    hosts = _load_if_exists(paths.config_dir / "hosts.yaml")
-    settings = _load_if_exists(paths.config_dir / "settings.yaml")
+    present = _existing_config_files(paths.config_dir)
+
+    def _load(name: str) -> Dict[str, Any]:
+        return safe_load_yaml(paths.config_dir / name) if name in present else {}
+
+    authors = _load("authors.yaml")
+    hosts = _load("hosts.yaml")
+    settings = _load("settings.yaml")
     return BrsConfig(repo=repo, authors=authors, hosts=hosts, settings=settings)
 
 
+def brs_ctx(brs_cfg: BrsConfig) -> Dict[str, Any]:
+    """The ctx.brs mapping for a loaded BRS config."""
+    return {"repo": brs_cfg.repo, "authors": brs_cfg.authors, "hosts": brs_cfg.hosts, "settings": brs_cfg.settings}
+
+
 def template_descriptor_path(template_id: str, root: Optional[Path] = None) -> Path:
     """
     Path to the template descriptor file.
 
-    Supports both names for compatibility:
+    Supports both names for compatibility (see TEMPLATE_DESCRIPTOR_NAMES):
       - templates/<id>/template_config.yaml (preferred)
       - templates/<id>/template.config.yaml (legacy)
+
+    Falls back to the legacy path when neither exists.
     """
     base = get_paths(root).templates_dir / template_id
-    preferred = base / "template_config.yaml"
-    legacy = base / "template.config.yaml"
-    return preferred if preferred.exists() else legacy
+    for name in TEMPLATE_DESCRIPTOR_NAMES:
+        p = base / name
+        if p.exists():
+            return p
+    return base / TEMPLATE_DESCRIPTOR_NAMES[-1]
 
 
 def template_exists(template_id: str, root: Optional[Path] = None) -> bool:
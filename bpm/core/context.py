@@ -1,8 +1,8 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
-import socket
 from typing import Any, Dict, Optional
+from bpm.core import env
 from bpm.utils.time import now_iso
 
 
@@ -70,7 +70,7 @@ class Ctx:
         """
         Return a short hostname. Useful for host-aware defaults.
         """
-        return socket.gethostname().split(".")[0]
+        return env.short_hostname()
 
     def materialize(self, hostpath: str) -> str:
         """
@@ -82,8 +82,8 @@ class Ctx:
 
         Later (HostPath integration) this will consult config/hosts.yaml.
         """
-        if ":" in hostpath:
-            _, rest = hostpath.split(":", 1)
+        _, sep, rest = hostpath.partition(":")
+        if sep:
             return rest if rest.startswith("/") else f"/{rest}"
         return hostpath
 
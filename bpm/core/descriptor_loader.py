@@ -85,8 +85,7 @@ def load(template_id: str) -> Descriptor:
     """
     p = brs_loader.template_descriptor_path(template_id)
     if not p.exists():
-        tdir = brs_loader.get_paths().templates_dir / template_id
-        preferred = tdir / "template_config.yaml"
+        preferred = p.with_name(brs_loader.TEMPLATE_DESCRIPTOR_NAMES[0])
         raise FileNotFoundError(
             f"Template '{template_id}' not found in active BRS. "
             f"Expected descriptor at {preferred}."
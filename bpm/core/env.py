@@ -1,19 +1,32 @@
 from __future__ import annotations
+import functools
 import os
+import socket
 from pathlib import Path
 from typing import Tuple
+from bpm.io.fs import mkdirp
 from bpm.io.yamlio import safe_load_yaml, safe_dump_yaml
 from bpm.models.store_index import StoreIndex, StoreRecord
 from bpm.utils.time import now_iso
 
 DEFAULT_CACHE_DIRNAME = ".bpm_cache"
 
+# Cache roots whose directories were already created in this process
+_ensured_roots: set[Path] = set()
+
 def get_cache_root() -> Path:
-    """Return the BPM cache root (creates it if missing)."""
+    """
+    Return the BPM cache root (creates it if missing).
+
+    The directory is created once per process; the write paths below
+    re-create what they need, so deleting the cache under a running
+    process does not break later writes.
+    """
     cache = os.environ.get("BPM_CACHE")
     root = Path(cache).expanduser().resolve() if cache else Path.home() / DEFAULT_CACHE_DIRNAME
-    root.mkdir(parents=True, exist_ok=True)
-    (root / "brs").mkdir(parents=True, exist_ok=True)
+    if root not in _ensured_roots:
+        (root / "brs").mkdir(parents=True, exist_ok=True)
+        _ensured_roots.add(root)
     return root
 
 def get_stores_yaml_path() -> Path:
@@ -23,6 +36,7 @@ def load_store_index() -> StoreIndex:
     p = get_stores_yaml_path()
     if not p.exists():
         idx = StoreIndex(schema_version=1, updated=now_iso(), active=None, stores={})
+        mkdirp(p.parent)
         safe_dump_yaml(p, {
             "schema_version": idx.schema_version,
             "updated": idx.updated,
@@ -65,7 +79,16 @@ def save_store_index(idx: StoreIndex) -> None:
             } for k, v in (idx.stores or {}).items()
         },
     }
+    mkdirp(p.parent)
     safe_dump_yaml(p, data)
 
 def get_brs_cache_dir() -> Path:
-    return get_cache_root() / "brs"
\ No newline at end of file
+    """Directory holding cached BRS copies; created on demand for writers."""
+    d = get_cache_root() / "brs"
+    mkdirp(d)
+    return d
+
+@functools.lru_cache(maxsize=1)
+def short_hostname() -> str:
+    """Short hostname of this machine (looked up once per process)."""
+    return socket.gethostname().partition(".")[0]
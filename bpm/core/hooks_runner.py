@@ -3,10 +3,11 @@ import importlib
 import sys
 from dataclasses import dataclass
 from types import ModuleType
-from typing import Any, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, List, Tuple
 import logging
 
 from bpm.core import brs_loader
+from bpm.io.fs import package_stamp
 
 
 @dataclass(frozen=True)
@@ -33,18 +34,35 @@ def _purge_module_prefix(prefix: str) -> None:
         sys.modules.pop(k, None)
 
 
+# (brs_root, module, func) -> (module file, stamp of its hooks package, callable)
+_callable_cache: Dict[Tuple[str, str, str], Tuple[str, Tuple[Any, ...], Any]] = {}
+
+
 def _import_callable(call: HookCall) -> Any:
     """
     Import the callable from the active BRS.
 
     Steps:
+      - Reuse a previously imported callable while no .py file of its
+        top-level package has changed
       - Purge cached 'hooks' package (and submodules) from sys.modules
       - Prepend active BRS root to sys.path
       - importlib.import_module(module) and getattr(func)
       - Remove BRS root from sys.path
+
+    A reused callable keeps its module alive, so module-level state in a
+    hook persists between calls until the package is edited.
     """
     brs_root = brs_loader.get_paths().root
-    top_pkg = call.module.split(".", 1)[0] if "." in call.module else call.module
+    top_pkg = call.module.partition(".")[0]
+    key = (str(brs_root), call.module, call.func)
+    hit = _callable_cache.get(key)
+    if hit is not None:
+        try:
+            if package_stamp(brs_root, top_pkg, hit[0]) == hit[1]:
+                return hit[2]
+        except OSError:
+            pass
     _purge_module_prefix(top_pkg)
 
     sys_path_added = False
@@ -56,6 +74,12 @@ def _import_callable(call: HookCall) -> Any:
         fn = getattr(mod, call.func, None)
         if fn is None:
             raise AttributeError(f"Function '{call.func}' not found in module '{call.module}'")
+        src = getattr(mod, "__file__", None)
+        if src:
+            try:
+                _callable_cache[key] = (src, package_stamp(brs_root, top_pkg, src), fn)
+            except OSError:
+                pass
         return fn
     finally:
         if sys_path_added:
@@ -1,4 +1,6 @@
 from __future__ import annotations
+import functools
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Tuple
@@ -30,11 +32,14 @@ class PlanItem:
     dst: str
 
 
+@functools.lru_cache(maxsize=32)
 def _jinja_env(template_root: Path) -> Environment:
     """
     Build a Jinja2 environment rooted at the template folder.
 
     We use StrictUndefined so missing variables fail fast during tests.
+    Environments are reused per template root so compiled templates stay
+    in Jinja's cache; auto_reload recompiles a source whose mtime changed.
     """
     loader = FileSystemLoader(str(template_root))
     env = Environment(
@@ -130,10 +135,21 @@ def render(desc: Descriptor, ctx: Ctx, *, dry: bool = False) -> List[PlanItem]:
     # Prepare Jinja environment
     env = _jinja_env(tpl_root)
 
+    # The mkdir step creates target_dir up front; nested destination folders
+    # are created once each, only right before their first write.
+    made: set[str] = set()
+
+    def _ensure_parent(dst: str) -> None:
+        parent = os.path.normpath(os.path.dirname(dst))
+        if parent not in made:
+            mkdirp(parent)
+            made.add(parent)
+
     # Execute plan
     for step in plan:
         if step.action == "mkdir":
             mkdirp(step.dst)
+            made.add(os.path.normpath(step.dst))
 
         elif step.action == "render":
             src_rel = Path(step.src).relative_to(tpl_root)
@@ -151,10 +167,12 @@ def render(desc: Descriptor, ctx: Ctx, *, dry: bool = False) -> List[PlanItem]:
             except TemplateSyntaxError as e:
                 fname = e.filename or str(src_rel)
                 raise RuntimeError(f"Jinja syntax error in {fname}:{e.lineno}: {e.message}") from e
-            write_text(step.dst, content)
+            _ensure_parent(step.dst)
+            write_text(step.dst, content, make_parents=False)
 
         elif step.action == "copy":
-            copy_file(step.src, step.dst)
+            _ensure_parent(step.dst)
+            copy_file(step.src, step.dst, make_parents=False)
 
         elif step.action == "chmod":
             make_executable(step.dst)
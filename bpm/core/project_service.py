@@ -2,10 +2,9 @@ from __future__ import annotations
 import re
 import shutil
 from pathlib import Path
-import socket
 from typing import Any, Dict, Iterable, List, Optional
 
-from bpm.core import brs_loader
+from bpm.core import brs_loader, env
 from bpm.core.project_io import load as load_project, save as save_project, project_file_path
 from bpm.utils.time import now_iso
 from bpm.utils.table import kv_aligned
@@ -61,7 +60,7 @@ def _resolve_host_key(hosts_cfg: dict, settings_cfg: dict) -> str:
       2) settings.default_host if present in hosts
       3) 'local'
     """
-    short = socket.gethostname().split(".")[0]
+    short = env.short_hostname()
     hosts_map = (hosts_cfg or {}).get("hosts") or {}
     # direct match on key
     if short in hosts_map:
@@ -259,26 +258,30 @@ def adopt(
 # --------------------------- template removal ---------------------------
 
 def _iter_leaf_values(value: Any, key_path: str = ""):
-    if isinstance(value, dict):
-        for k, v in value.items():
-            next_path = f"{key_path}.{k}" if key_path else str(k)
-            yield from _iter_leaf_values(v, next_path)
-        return
-    if isinstance(value, list):
-        for i, v in enumerate(value):
-            next_path = f"{key_path}[{i}]" if key_path else f"[{i}]"
-            yield from _iter_leaf_values(v, next_path)
-        return
-    yield key_path, value
-
-
-def _string_mentions_template(value: str, template_id: str, rendered_dir: Path, project_dir: Path) -> bool:
-    s = str(value).strip()
-    if not s:
-        return False
-    normalized = s.replace("\\", "/")
+    # Explicit stack instead of recursive generators: each nesting level of
+    # `yield from` would otherwise add a frame every leaf has to pass through.
+    stack: list[tuple[str, Any]] = [(key_path, value)]
+    while stack:
+        path, cur = stack.pop()
+        if isinstance(cur, dict):
+            children = [(f"{path}.{k}" if path else str(k), v) for k, v in cur.items()]
+        elif isinstance(cur, list):
+            children = [(f"{path}[{i}]" if path else f"[{i}]", v) for i, v in enumerate(cur)]
+        else:
+            yield path, cur
+            continue
+        # Push in reverse so leaves come out in document order
+        stack.extend(reversed(children))
+
+
+def _template_ref_patterns(template_id: str, rendered_dir: Path, project_dir: Path) -> tuple[str, ...]:
+    """
+    Substrings that indicate a value points at the rendered template folder.
+
+    Computed once per lookup: resolving the folders hits the filesystem, so it
+    must not happen for every leaf value that gets scanned.
+    """
     rendered_posix = rendered_dir.resolve().as_posix()
-    project_posix = project_dir.resolve().as_posix()
     rel_posix = rendered_dir.relative_to(project_dir).as_posix()
     patterns = (
         template_id,
@@ -291,11 +294,20 @@ def _string_mentions_template(value: str, template_id: str, rendered_dir: Path,
         f"/{template_id}/",
         f"{template_id}/",
     )
-    return any(p and p in normalized for p in patterns)
+    return tuple(p for p in patterns if p)
+
+
+def _string_mentions_template(value: str, patterns: tuple[str, ...]) -> bool:
+    s = str(value).strip()
+    if not s:
+        return False
+    normalized = s.replace("\\", "/")
+    return any(p in normalized for p in patterns)
 
 
 def _find_template_references(project: Dict[str, Any], template_id: str, rendered_dir: Path, project_dir: Path) -> List[Dict[str, str]]:
     refs: List[Dict[str, str]] = []
+    patterns = _template_ref_patterns(template_id, rendered_dir, project_dir)
     for entry in project.get("templates") or []:
         src_id = str(entry.get("id") or "")
         if src_id == template_id:
@@ -303,7 +315,7 @@ def _find_template_references(project: Dict[str, Any], template_id: str, rendere
         for section in ("params", "published"):
             data = entry.get(section) or {}
             for key_path, value in _iter_leaf_values(data):
-                if isinstance(value, str) and _string_mentions_template(value, template_id, rendered_dir, project_dir):
+                if isinstance(value, str) and _string_mentions_template(value, patterns):
                     refs.append(
                         {
                             "template_id": src_id,
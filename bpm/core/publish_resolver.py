@@ -2,9 +2,12 @@ from __future__ import annotations
 import importlib
 import sys
 import logging
-from typing import Any, Dict
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Tuple
 
 from bpm.core import brs_loader
+from bpm.io.fs import package_stamp
 
 
 logger = logging.getLogger("bpm.resolvers")
@@ -20,6 +23,10 @@ def _purge_module_prefix(prefix: str) -> None:
         sys.modules.pop(k, None)
 
 
+# (brs_root, dotted) -> (module file, stamp of its package, callable); see hooks_runner
+_resolver_cache: Dict[Tuple[str, str], Tuple[str, Tuple[Any, ...], Any]] = {}
+
+
 def _import_resolver(dotted: str):
     """
     Import a resolver from the active BRS root.
@@ -27,10 +34,40 @@ def _import_resolver(dotted: str):
     Supported forms:
       - 'resolvers.my_pub'         -> calls 'main'
       - 'resolvers.my_pub:compute' -> calls 'compute'
+
+    A callable imported earlier is reused while no .py file of its
+    top-level package has changed.
     """
     dotted = dotted.strip()
     brs_root = brs_loader.get_paths().root
-    top_pkg = dotted.split(".", 1)[0]
+    top_pkg = dotted.partition(".")[0]
+    key = (str(brs_root), dotted)
+    hit = _resolver_cache.get(key)
+    if hit is not None:
+        try:
+            if package_stamp(brs_root, top_pkg, hit[0]) == hit[1]:
+                return hit[2]
+        except OSError:
+            pass
+    # Stamp the module named by `dotted`, not fn.__module__: a resolver may
+    # re-export a function defined elsewhere.
+    mod, fn = _load_resolver(dotted, brs_root)
+    src = getattr(mod, "__file__", None)
+    if src:
+        try:
+            _resolver_cache[key] = (src, package_stamp(brs_root, top_pkg, src), fn)
+        except OSError:
+            pass
+    return fn
+
+
+def _load_resolver(dotted: str, brs_root: Path) -> Tuple[ModuleType, Any]:
+    """
+    Purge the resolver package and import ``dotted`` from brs_root.
+
+    Returns (module, callable), where module is the one ``dotted`` names.
+    """
+    top_pkg = dotted.partition(".")[0]
     _purge_module_prefix(top_pkg)
 
     sys_path_added = False
@@ -45,14 +82,14 @@ def _import_resolver(dotted: str):
             fn = getattr(mod, func, None)
             if fn is None:
                 raise AttributeError(f"Function '{func}' not found in module '{module}'")
-            return fn
+            return mod, fn
 
         # Case 2: try import dotted as a module and use main
         try:
             mod = importlib.import_module(dotted)
             fn = getattr(mod, "main", None)
             if fn is not None:
-                return fn
+                return mod, fn
         except Exception:
             pass
 
@@ -63,14 +100,14 @@ def _import_resolver(dotted: str):
             fn = getattr(mod, func, None)
             if fn is None:
                 raise AttributeError(f"Function '{func}' not found in module '{module}'")
-            return fn
+            return mod, fn
 
         # Case 4: bare module name → main
         mod = importlib.import_module(dotted)
         fn = getattr(mod, "main", None)
         if fn is None:
             raise AttributeError(f"Function 'main' not found in module '{dotted}'")
-        return fn
+        return mod, fn
     finally:
         if sys_path_added:
             try:
@@ -96,6 +133,11 @@ def resolve_all(publish_cfg: Dict[str, Dict[str, Any]], ctx: Any, project: Dict[
     tpl_id = ctx.template.id
     entry = _find_or_create_template_entry(project, tpl_id)
     pub = entry.setdefault("published", {})
+    # Several publish keys often share a resolver; look each one up only once
+    # per call. _import_resolver already reuses unchanged modules across
+    # calls, so this saves the active-BRS lookup and stat per repeated key and
+    # keeps all keys of one call on the same resolver version.
+    loaded: Dict[str, Any] = {}
 
     for key, spec in publish_cfg.items():
         if not isinstance(spec, dict) or "resolver" not in spec:
@@ -103,7 +145,9 @@ def resolve_all(publish_cfg: Dict[str, Dict[str, Any]], ctx: Any, project: Dict[
         dotted = spec["resolver"]
         args = spec.get("args") or {}
 
-        fn = _import_resolver(dotted)
+        fn = loaded.get(dotted)
+        if fn is None:
+            fn = loaded[dotted] = _import_resolver(dotted)
         logger.info("[resolver] start %s", dotted)
         value = fn(ctx, **args) if args else fn(ctx)
         logger.info("[resolver] done %s -> %s", dotted, value)
@@ -10,6 +10,9 @@ from bpm.io.yamlio import safe_load_yaml
 from bpm.models.store_index import StoreRecord, StoreIndex
 from bpm.utils.time import now_iso
 
+# Keys every BRS repo.yaml must define (reported in this order when missing)
+REQUIRED_REPO_KEYS = ("id", "name", "description", "version", "maintainer")
+
 class StoreError(Exception):
     pass
 
@@ -18,8 +21,7 @@ def _read_repo_yaml(path: Path) -> dict:
     if not p.exists():
         raise StoreError(f"repo.yaml not found in {path}")
     data = safe_load_yaml(p)
-    required = ["id", "name", "description", "version", "maintainer"]
-    missing = [k for k in required if k not in data]
+    missing = [k for k in REQUIRED_REPO_KEYS if k not in data]
     if missing:
         raise StoreError(f"repo.yaml missing keys: {', '.join(missing)}")
     return data
@@ -40,9 +42,17 @@ def _git_clone(url: str, dest: Path) -> None:
     Raises StoreError on failure.
     """
     try:
-        subprocess.check_call(["git", "clone", "--depth", "1", url, str(dest)])
+        proc = subprocess.run(
+            ["git", "clone", "--depth", "1", "--quiet", url, str(dest)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
     except Exception as e:
         raise StoreError(f"Failed to clone Git repo: {url}: {e}")
+    if proc.returncode != 0:
+        detail = (proc.stderr or "").strip() or f"exit code {proc.returncode}"
+        raise StoreError(f"Failed to clone Git repo: {url}: {detail}")
 
 def _detect_git_commit(path: Path) -> Optional[str]:
     if not (path / ".git").exists():
@@ -59,6 +69,11 @@ def _copy_brs_tree(src: Path, dest: Path) -> None:
       - Do not traverse symlinks (copy links as links) to avoid recursion
       - Ignore VCS metadata and any nested 'brs' folder at the repo root
     """
+    # copytree hands the root back to _ignore exactly as given, and with
+    # symlinks=True it never descends through links, so a plain string
+    # compare identifies the root without resolving every directory.
+    root = os.fspath(src)
+
     def _ignore(dirpath: str, names: list[str]):
         ignore: set[str] = set()
         # Ignore VCS folders everywhere
@@ -66,17 +81,25 @@ def _copy_brs_tree(src: Path, dest: Path) -> None:
             if n in names:
                 ignore.add(n)
         # If the source contains its own cache folder (brs/), skip it at the repo root
-        try:
-            if Path(dirpath).resolve() == src.resolve() and "brs" in names:
-                ignore.add("brs")
-        except Exception:
-            pass
+        if dirpath == root and "brs" in names:
+            ignore.add("brs")
         return list(ignore)
 
     # Allow copying into an existing empty/temporary directory
     shutil.copytree(src, dest, symlinks=True, ignore=_ignore, dirs_exist_ok=True)
 
 
+def _move_aside(dest: Path) -> Optional[Path]:
+    """Rename an existing dest to a sibling scratch name; return it (or None)."""
+    if not dest.exists():
+        return None
+    stale = dest.with_name(f".{dest.name}.stale-{os.getpid()}")
+    if stale.exists():
+        shutil.rmtree(stale, ignore_errors=True)
+    dest.rename(stale)
+    return stale
+
+
 def add(source: str, activate: bool = False) -> StoreRecord:
     """
     Add a BRS from local path or git URL (local path only in tests).
@@ -85,75 +108,75 @@ def add(source: str, activate: bool = False) -> StoreRecord:
     idx = env.load_store_index()
     brs_cache = env.get_brs_cache_dir()
 
-    # Determine source type
-    if _is_git_url(source):
-        # Clone into a temporary directory first, then move into place
-        tmp_parent = env.get_brs_cache_dir()
-        tmp_dir = Path(tempfile.mkdtemp(prefix=".tmp-clone-", dir=str(tmp_parent)))
-        try:
-            clone_dir = tmp_dir / "repo"
-            _git_clone(source, clone_dir)
-            meta = _read_repo_yaml(clone_dir)
-            brs_id = meta["id"]
-            dest = env.get_brs_cache_dir() / brs_id
-            if dest.exists():
-                shutil.rmtree(dest)
-            # Move the cloned repo to the cache location (preserves .git)
-            clone_dir.rename(dest)
-            commit = _detect_git_commit(dest)
-        finally:
-            # Clean up temp dir if still around
-            if tmp_dir.exists():
-                shutil.rmtree(tmp_dir, ignore_errors=True)
-        src_repr = source
-        version = str(meta["version"])
-    else:
-        src = Path(source).resolve()
-        if not src.exists():
-            raise StoreError(f"Source path not found: {src}")
+    # An existing copy at dest is moved aside first. Until the new copy and
+    # the index are both in place, any failure puts it back; it is only
+    # deleted once everything succeeded.
+    stale: Optional[Path] = None
+    try:
+        # Determine source type
+        if _is_git_url(source):
+            # Clone into a temporary directory first, then move into place
+            tmp_parent = env.get_brs_cache_dir()
+            tmp_dir = Path(tempfile.mkdtemp(prefix=".tmp-clone-", dir=str(tmp_parent)))
+            try:
+                clone_dir = tmp_dir / "repo"
+                _git_clone(source, clone_dir)
+                meta = _read_repo_yaml(clone_dir)
+                brs_id = meta["id"]
+                dest = env.get_brs_cache_dir() / brs_id
+                stale = _move_aside(dest)
+                # Move the cloned repo to the cache location (preserves .git)
+                clone_dir.rename(dest)
+                commit = _detect_git_commit(dest)
+            finally:
+                # Clean up temp dir if still around
+                if tmp_dir.exists():
+                    shutil.rmtree(tmp_dir, ignore_errors=True)
+            src_repr = source
+            version = str(meta["version"])
+        else:
+            src = Path(source).resolve()
+            if not src.exists():
+                raise StoreError(f"Source path not found: {src}")
 
-        # Read repo.yaml to get id/version
-        meta = _read_repo_yaml(src)
-        brs_id = meta["id"]
-        dest = brs_cache / brs_id
+            # Read repo.yaml to get id/version
+            meta = _read_repo_yaml(src)
+            brs_id = meta["id"]
+            dest = brs_cache / brs_id
 
-        # Safety guard: prevent copying the source into a subdirectory of itself
-        # This happens if BPM_CACHE points inside the source tree, leading to recursive paths.
-        try:
-            # Path.is_relative_to is available in Python 3.9+
+            # Safety guard: prevent copying the source into a subdirectory of itself
+            # This happens if BPM_CACHE points inside the source tree, leading to recursive paths.
             if dest.resolve().is_relative_to(src):
                 raise StoreError(
                     "BPM cache directory is inside the BRS source. Set BPM_CACHE to a location "
                     "outside the source (e.g., ~/.bpm_cache)."
                 )
-        except AttributeError:
-            # Fallback for older Python: string prefix check
-            if str(dest.resolve()).startswith(str(src) + os.sep):
-                raise StoreError(
-                    "BPM cache directory is inside the BRS source. Set BPM_CACHE to a location "
-                    "outside the source (e.g., ~/.bpm_cache)."
-                )
 
-        # Copy or refresh
-        if dest.exists():
-            shutil.rmtree(dest)
-        _copy_brs_tree(src, dest)
-
-        commit = _detect_git_commit(dest)
-        src_repr = str(src)
-        version = str(meta["version"])
-    rec = StoreRecord(
-        id=brs_id,
-        source=src_repr,
-        cache_path=str(dest),
-        version=version,
-        commit=commit,
-        last_updated=now_iso(),
-    )
-    idx.stores[brs_id] = rec
-    if activate:
-        idx.active = brs_id
-    env.save_store_index(idx)
+            # Copy or refresh
+            stale = _move_aside(dest)
+            _copy_brs_tree(src, dest)
+            commit = _detect_git_commit(dest)
+            src_repr = str(src)
+            version = str(meta["version"])
+        rec = StoreRecord(
+            id=brs_id,
+            source=src_repr,
+            cache_path=str(dest),
+            version=version,
+            commit=commit,
+            last_updated=now_iso(),
+        )
+        idx.stores[brs_id] = rec
+        if activate:
+            idx.active = brs_id
+        env.save_store_index(idx)
+    except Exception:
+        if stale is not None:
+            shutil.rmtree(dest, ignore_errors=True)
+            stale.rename(dest)
+        raise
+    if stale is not None:
+        shutil.rmtree(stale, ignore_errors=True)
     return rec
 
 def activate(brs_id: str) -> None:
@@ -322,9 +345,9 @@ def update(brs_id: str, *, force: bool = False, check: bool = False) -> StoreRec
                     shutil.rmtree(tmp_dir, ignore_errors=True)
         finally:
             _release_lock(lock)
+        # Cache contents changed; re-read metadata from the new copy
+        cache_meta = _read_repo_yaml(cache_path)
 
-    # Re-read metadata from cache after potential update
-    cache_meta = _read_repo_yaml(cache_path)
     commit = _detect_git_commit(cache_path)
     rec.version = str(cache_meta.get("version", ""))
     rec.commit = commit
@@ -1,11 +1,11 @@
 from __future__ import annotations
-import socket
+import os
 from dataclasses import dataclass, replace
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, Dict, List, Tuple, Optional
 
-from bpm.core import brs_loader
+from bpm.core import brs_loader, env
 from bpm.core.context import build as build_ctx
 from bpm.core.descriptor_loader import load as load_desc, Descriptor
 from bpm.utils.interpolate import interpolate_ctx_string
@@ -67,7 +67,7 @@ def _parse_cli_params(param_pairs: List[str]) -> Dict[str, str]:
 
 
 def _hostname() -> str:
-    return socket.gethostname().split(".")[0]
+    return env.short_hostname()
 
 
 def _determine_host_key(project: Optional[Dict[str, Any]], hosts_cfg: Dict[str, Any], settings_cfg: Dict[str, Any]) -> str:
@@ -76,10 +76,9 @@ def _determine_host_key(project: Optional[Dict[str, Any]], hosts_cfg: Dict[str,
     """
     if project:
         ppath = str(project.get("project_path") or "")
-        if ":" in ppath:
-            host = ppath.split(":", 1)[0]
-            if host:
-                return host
+        host, sep, _ = ppath.partition(":")
+        if sep and host:
+            return host
     hosts_map = (hosts_cfg or {}).get("hosts") if isinstance(hosts_cfg, dict) else {}
     short = _hostname()
     if short in (hosts_map or {}):
@@ -95,10 +94,19 @@ def _determine_host_key(project: Optional[Dict[str, Any]], hosts_cfg: Dict[str,
 
 
 def _is_hostpath_string(val: str) -> bool:
-    if ":" not in val:
-        return False
-    host, rest = val.split(":", 1)
-    return bool(host) and rest.startswith("/")
+    host, sep, rest = val.partition(":")
+    return bool(sep and host) and rest.startswith("/")
+
+
+def _local_realpath(val: str, base_dir: Path) -> str:
+    """
+    Resolve a local path param (``~`` expanded, relative to base_dir) with
+    string-level os.path calls instead of building intermediate Path objects.
+    """
+    raw = os.path.expanduser(val)
+    if not os.path.isabs(raw):
+        raw = os.path.join(base_dir, raw)
+    return os.path.realpath(raw)
 
 
 def _hostify_params(params: Dict[str, Any], desc: Descriptor, host_key: str, base_dir: Path) -> Dict[str, Any]:
@@ -108,6 +116,8 @@ def _hostify_params(params: Dict[str, Any], desc: Descriptor, host_key: str, bas
     if not desc.params:
         return dict(params)
     out = dict(params)
+    # Several params often point at the same folder; resolve each value once
+    converted: Dict[str, str] = {}
     for pname, pspec in desc.params.items():
         if not getattr(pspec, "exists", None):
             continue
@@ -116,12 +126,9 @@ def _hostify_params(params: Dict[str, Any], desc: Descriptor, host_key: str, bas
             continue
         if _is_hostpath_string(val):
             continue
-        raw = Path(val).expanduser()
-        if raw.is_absolute():
-            resolved = raw.resolve()
-        else:
-            resolved = (base_dir / raw).resolve()
-        out[pname] = f"{host_key}:{resolved.as_posix()}"
+        if val not in converted:
+            converted[val] = f"{host_key}:{_local_realpath(val, base_dir).replace(os.sep, '/')}"
+        out[pname] = converted[val]
     return out
 
 
@@ -134,21 +141,22 @@ def _materialize_params(params: Dict[str, Any], desc: Descriptor, hosts_cfg: Dic
     out = dict(params)
     hosts_map = (hosts_cfg or {}).get("hosts") if isinstance(hosts_cfg, dict) else {}
     current_host = _hostname()
+    converted: Dict[str, str] = {}
     for pname, pspec in desc.params.items():
         if not getattr(pspec, "exists", None):
             continue
         val = out.get(pname)
         if not isinstance(val, str) or not val.strip():
             continue
+        if val in converted:
+            out[pname] = converted[val]
+            continue
         if _is_hostpath_string(val):
             hp = HostPath.from_raw(val, current_host=current_host)
-            out[pname] = hp.materialize(hosts_map or {}, fallback_prefix=None)
-            continue
-        raw = Path(val).expanduser()
-        if raw.is_absolute():
-            out[pname] = str(raw.resolve())
+            local = hp.materialize(hosts_map or {}, fallback_prefix=None)
         else:
-            out[pname] = str((base_dir / raw).resolve())
+            local = _local_realpath(val, base_dir)
+        converted[val] = out[pname] = local
     return out
 
 
@@ -163,6 +171,7 @@ def render(
     dry: bool = False,
     adhoc_out: Optional[Path] = None,
     adhoc: bool = False,
+    desc: Descriptor | None = None,
 ) -> List[Tuple[str, str | None, str]]:
     """
     Render a template into the project.
@@ -181,6 +190,7 @@ def render(
         params_kv: List of "KEY=VALUE" CLI parameters (generic).
         dry: If True, do not write files; just return the plan (list of PlanItems).
         adhoc: Force ad-hoc mode even without an explicit --out (requires resolver).
+        desc: Already-loaded descriptor for template_id (loaded here if omitted).
 
     Returns:
         The rendering plan (list of PlanItems) for inspection/testing (each is (action, src, dst)).
@@ -190,7 +200,9 @@ def render(
     """
     # 1) load BRS + descriptor
     brs_cfg = brs_loader.load_config()
-    desc = load_desc(template_id)
+    brs_ctx = brs_loader.brs_ctx(brs_cfg)
+    if desc is None:
+        desc = load_desc(template_id)
     instance_id = alias.strip() if alias else template_id
     adhoc_mode = bool(adhoc_out or adhoc)
 
@@ -221,6 +233,8 @@ def render(
 
     # 3b) optional param existence validation (paths)
     missing_paths: list[str] = []
+    # Relative inputs resolve against cwd (ad-hoc) or the project dir
+    base_dir = Path.cwd() if adhoc_mode else project_dir
     for pname, pspec in (desc.params or {}).items():
         kind = getattr(pspec, "exists", None)
         if not kind:
@@ -233,8 +247,7 @@ def render(
         if raw.is_absolute():
             p = raw.resolve()
         else:
-            base = Path.cwd() if adhoc_mode else project_dir
-            p = (base / raw).resolve()
+            p = (base_dir / raw).resolve()
         if kind == "file" and not p.is_file():
             missing_paths.append(f"{pname} -> {p}")
         elif kind == "dir" and not p.is_dir():
@@ -254,7 +267,7 @@ def render(
                 None,
                 instance_id,
                 final_params,
-                {"repo": brs_cfg.repo, "authors": brs_cfg.authors, "hosts": brs_cfg.hosts, "settings": brs_cfg.settings},
+                brs_ctx,
                 Path.cwd(),
                 source_id=template_id,
             )
@@ -270,13 +283,13 @@ def render(
         target_cwd.mkdir(parents=True, exist_ok=True)
         # Override render_into to "." so files render directly under adhoc_out
         desc_eff = replace(desc, render_into=".", parent_directory=None)
-        ctx = build_ctx(None, instance_id, final_params, {"repo": brs_cfg.repo, "authors": brs_cfg.authors, "hosts": brs_cfg.hosts, "settings": brs_cfg.settings}, target_cwd, source_id=template_id)
+        ctx = build_ctx(None, instance_id, final_params, brs_ctx, target_cwd, source_id=template_id)
         # Hooks: pre_render (run in both project and ad-hoc modes)
         if desc.hooks and desc.hooks.get("pre_render"):
             run_hooks(desc.hooks["pre_render"], ctx)
         plan = jinja_render(desc_eff, ctx, dry=dry)
     else:
-        ctx = build_ctx(project, instance_id, final_params, {"repo": brs_cfg.repo, "authors": brs_cfg.authors, "hosts": brs_cfg.hosts, "settings": brs_cfg.settings}, project_dir, source_id=template_id)
+        ctx = build_ctx(project, instance_id, final_params, brs_ctx, project_dir, source_id=template_id)
         # Hooks: pre_render (project mode)
         if desc.hooks and desc.hooks.get("pre_render"):
             run_hooks(desc.hooks["pre_render"], ctx)
@@ -343,6 +356,7 @@ def run(project_dir: Path, template_id: str, *, adhoc_out: Optional[Path] = None
       5) On success, set template status='completed' and save project.yaml.
     """
     brs_cfg = brs_loader.load_config()
+    brs_ctx = brs_loader.brs_ctx(brs_cfg)
     # For ad-hoc mode, template_id is the descriptor id
     if adhoc_out:
         desc = load_desc(template_id)
@@ -351,7 +365,7 @@ def run(project_dir: Path, template_id: str, *, adhoc_out: Optional[Path] = None
         meta = _load_meta(out_dir)
         params_raw = meta.get("params") or {}
         params = _materialize_params(params_raw, desc, brs_cfg.hosts, out_dir)
-        ctx = build_ctx(None, template_id, params, {"repo": brs_cfg.repo, "authors": brs_cfg.authors, "hosts": brs_cfg.hosts, "settings": brs_cfg.settings}, out_dir, source_id=template_id)
+        ctx = build_ctx(None, template_id, params, brs_ctx, out_dir, source_id=template_id)
 
         # Hooks: pre_run (enabled in ad-hoc)
         if desc.hooks and desc.hooks.get("pre_run"):
@@ -378,7 +392,7 @@ def run(project_dir: Path, template_id: str, *, adhoc_out: Optional[Path] = None
 
         params = entry.get("params") or {}
         params_local = _materialize_params(params, desc, brs_cfg.hosts, project_dir)
-        ctx = build_ctx(project, template_id, params_local, {"repo": brs_cfg.repo, "authors": brs_cfg.authors, "hosts": brs_cfg.hosts, "settings": brs_cfg.settings}, project_dir, source_id=source_id)
+        ctx = build_ctx(project, template_id, params_local, brs_ctx, project_dir, source_id=source_id)
 
         # Hooks: pre_run
         if desc.hooks and desc.hooks.get("pre_run"):
@@ -412,6 +426,7 @@ def publish(project_dir: Path, template_id: str, *, adhoc_out: Optional[Path] =
         The resulting 'published' dict for this template.
     """
     brs_cfg = brs_loader.load_config()
+    brs_ctx = brs_loader.brs_ctx(brs_cfg)
 
     if adhoc_out:
         desc = load_desc(template_id)
@@ -419,7 +434,7 @@ def publish(project_dir: Path, template_id: str, *, adhoc_out: Optional[Path] =
         meta = _load_meta(out_dir)
         params_raw = meta.get("params") or {}
         params = _materialize_params(params_raw, desc, brs_cfg.hosts, out_dir)
-        ctx = build_ctx(None, template_id, params, {"repo": brs_cfg.repo, "authors": brs_cfg.authors, "hosts": brs_cfg.hosts, "settings": brs_cfg.settings}, out_dir, source_id=template_id)
+        ctx = build_ctx(None, template_id, params, brs_ctx, out_dir, source_id=template_id)
         pub = resolve_publish(desc.publish, ctx, {})
         # Persist published to meta
         meta["published"] = pub
@@ -436,7 +451,7 @@ def publish(project_dir: Path, template_id: str, *, adhoc_out: Optional[Path] =
         params = entry.get("params") or {}
 
         params_local = _materialize_params(params, desc, brs_cfg.hosts, project_dir)
-        ctx = build_ctx(project, template_id, params_local, {"repo": brs_cfg.repo, "authors": brs_cfg.authors, "hosts": brs_cfg.hosts, "settings": brs_cfg.settings}, project_dir, source_id=source_id)
+        ctx = build_ctx(project, template_id, params_local, brs_ctx, project_dir, source_id=source_id)
 
         pub = resolve_publish(desc.publish, ctx, project)
         save_project(project_dir, project)
@@ -138,12 +138,22 @@ def _write_ctx_json(ctx: Any) -> Path:
     return Path(tmp.name)
 
 
-def run(workflow_id: str, *, project_path: Optional[Path] = None, params_kv: List[str] | None = None) -> None:
+def run(
+    workflow_id: str,
+    *,
+    project_path: Optional[Path] = None,
+    params_kv: List[str] | None = None,
+    desc: WorkflowDescriptor | None = None,
+) -> None:
     """
     Execute the workflow's entry script from its workflow folder.
+
+    ``desc`` may be passed when the caller already loaded the descriptor.
     """
-    brs_cfg = brs_loader.load_config()
-    desc = load_descriptor(workflow_id)
+    paths = brs_loader.get_paths()
+    brs_cfg = brs_loader.load_config(paths.root)
+    if desc is None:
+        desc = load_descriptor(workflow_id)
     project, project_dir = _load_project_from_path(project_path)
 
     cli_params = {}
@@ -160,8 +170,8 @@ def run(workflow_id: str, *, project_path: Optional[Path] = None, params_kv: Lis
     }
     final_params = resolve_params(desc, cli_params, project, ctx_like)
 
-    wf_dir = brs_loader.get_paths().workflows_dir / workflow_id
-    ctx = build_ctx(project, workflow_id, final_params, {"repo": brs_cfg.repo, "authors": brs_cfg.authors, "hosts": brs_cfg.hosts, "settings": brs_cfg.settings}, wf_dir)
+    wf_dir = paths.workflows_dir / workflow_id
+    ctx = build_ctx(project, workflow_id, final_params, brs_loader.brs_ctx(brs_cfg), wf_dir)
 
     entry = desc.run_entry or "run.sh"
     entry_path = (wf_dir / entry).resolve()
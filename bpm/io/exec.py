@@ -1,4 +1,7 @@
 from __future__ import annotations
+import functools
+import os
+import shutil
 import subprocess
 from pathlib import Path
 from typing import Mapping, Sequence
@@ -26,3 +29,16 @@ def run_process(cmd: Sequence[str], cwd: Path, env: Mapping[str, str] | None = N
     rc = subprocess.run(cmd, cwd=str(cwd), env=env).returncode
     if rc != 0:
         raise ProcessError(f"Command failed with exit code {rc}: {' '.join(cmd)}")
+
+
+@functools.lru_cache(maxsize=256)
+def _which_on(program: str, path: str | None) -> str | None:
+    return shutil.which(program, path=path)
+
+
+def which(program: str) -> str | None:
+    """
+    Cached shutil.which: each program is looked up once per PATH value,
+    including misses, so repeated tool checks skip the PATH walk.
+    """
+    return _which_on(program, os.environ.get("PATH"))
@@ -4,29 +4,67 @@ import shutil
 from pathlib import Path
 
 
+def file_stamp(path: str | Path) -> tuple[int, int, int]:
+    """
+    Return (mtime_ns, size, inode) for a file; raises OSError if it is missing.
+
+    Used as the invalidation key of in-process caches: an in-place edit
+    changes mtime/size and an atomic replace changes the inode.
+    """
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def package_stamp(root: str | Path, top_pkg: str, module_file: str) -> tuple:
+    """
+    Stamp every .py file of package `top_pkg` under `root`.
+
+    Modules loaded from a BRS (hooks, resolvers) may import helpers from
+    their own package, so an edit to any of them must invalidate a cached
+    callable. Falls back to `module_file` alone when `top_pkg` is not a
+    package directory. Raises OSError if a file disappears meanwhile.
+    """
+    pkg_dir = os.path.join(os.fspath(root), top_pkg)
+    if not os.path.isdir(pkg_dir):
+        return ((module_file, file_stamp(module_file)),)
+    entries = []
+    for dirpath, dirnames, filenames in os.walk(pkg_dir):
+        dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+        for name in filenames:
+            if name.endswith(".py"):
+                path = os.path.join(dirpath, name)
+                entries.append((path, file_stamp(path)))
+    entries.sort()
+    return tuple(entries)
+
+
 def mkdirp(path: str | Path) -> None:
     """
     Create a directory (and parents) if missing. No-op if it exists.
     """
-    Path(path).mkdir(parents=True, exist_ok=True)
+    os.makedirs(os.fspath(path) or ".", exist_ok=True)
 
 
-def copy_file(src: str | Path, dst: str | Path) -> None:
+def copy_file(src: str | Path, dst: str | Path, *, make_parents: bool = True) -> None:
     """
-    Copy a file with metadata. Creates destination parent directories.
+    Copy a file with metadata. Creates destination parent directories
+    unless make_parents=False (caller already created them).
     """
     src = Path(src)
     dst = Path(dst)
-    mkdirp(dst.parent)
+    if make_parents:
+        mkdirp(dst.parent)
     shutil.copy2(src, dst)
 
 
-def write_text(path: str | Path, text: str) -> None:
+def write_text(path: str | Path, text: str, *, make_parents: bool = True) -> None:
     """
-    Write text to a file, creating parent directories if needed.
+    Write text to a file, creating parent directories if needed
+    (skipped with make_parents=False when the caller already created them).
     """
     path = Path(path)
-    mkdirp(path.parent)
+    if make_parents:
+        mkdirp(path.parent)
     path.write_text(text, encoding="utf-8", newline="\n")
 
 
@@ -1,27 +1,71 @@
 from __future__ import annotations
+import copy
 import io
 import os
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 import yaml
+from bpm.io.fs import file_stamp
 from bpm.utils.errors import YamlError
 
+# Prefer the libyaml-backed C implementations; fall back to pure Python
+# when PyYAML was built without libyaml.
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Parsed documents keyed by absolute path; each entry remembers the
+# (mtime_ns, size, inode) it was parsed from so edits invalidate it.
+_CACHE_SIZE = 64
+_cache: "OrderedDict[str, tuple[tuple[int, int, int], Any]]" = OrderedDict()
+
+
+def clear_yaml_cache() -> None:
+    """Drop all cached YAML documents (mainly for tests)."""
+    _cache.clear()
+
 
 def safe_load_yaml(path: str | Path) -> Any:
+    """
+    Load a YAML file into plain Python objects (never None).
+
+    Results are cached per process and reused while the file's mtime, size
+    and inode are unchanged. Callers always receive a deep copy, so they may
+    mutate the returned data freely.
+    """
+    key = os.path.abspath(path)
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+        stamp = file_stamp(key)
+        hit = _cache.get(key)
+        if hit is not None and hit[0] == stamp:
+            _cache.move_to_end(key)
+            return copy.deepcopy(hit[1])
+        # Hand libyaml raw bytes; it detects and decodes UTF-8/16 itself
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=_Loader) or {}
     except Exception as e:
         raise YamlError(f"Failed to read YAML: {path}: {e}") from e
+    _cache[key] = (stamp, data)
+    _cache.move_to_end(key)
+    if len(_cache) > _CACHE_SIZE:
+        _cache.popitem(last=False)
+    return copy.deepcopy(data)
 
 
 def safe_dump_yaml(path: str | Path, data: Any) -> None:
-    """Atomic write to prevent partial files."""
+    """Atomic write to prevent partial files.
+
+    The document is rendered in memory first and written with a single
+    call, rather than streamed to disk node by node.
+    """
     path = Path(path)
     tmp = path.with_suffix(path.suffix + ".tmp")
+    _cache.pop(os.path.abspath(path), None)
     try:
+        buf = io.StringIO()
+        yaml.dump(data, buf, Dumper=_Dumper, sort_keys=False)
         with open(tmp, "w", encoding="utf-8", newline="\n") as f:
-            yaml.safe_dump(data, f, sort_keys=False)
+            f.write(buf.getvalue())
         os.replace(tmp, path)  # atomic on POSIX
     except Exception as e:
         # try to clean temp
@@ -29,4 +73,4 @@ def safe_dump_yaml(path: str | Path, data: Any) -> None:
             if tmp.exists():
                 tmp.unlink()
         finally:
-            raise YamlError(f"Failed to write YAML: {path}: {e}") from e
\ No newline at end of file
+            raise YamlError(f"Failed to write YAML: {path}: {e}") from e
@@ -32,8 +32,8 @@ class HostPath:
           - '/abs'
         Returns canonical HostPath.
         """
-        if ":" in raw:
-            host, rest = raw.split(":", 1)
+        host, sep, rest = raw.partition(":")
+        if sep:
             path = rest if rest.startswith("/") else f"/{rest}"
             return HostPath(host=host, abs_posix=str(PurePosixPath(path)))
         else:
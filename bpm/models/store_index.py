@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from typing import Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class StoreRecord:
     id: str
     source: str
@@ -13,7 +13,7 @@ class StoreRecord:
     last_updated: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StoreIndex:
     schema_version: int = 1
     updated: Optional[str] = None
@@ -1,4 +1,4 @@
 from datetime import datetime, timezone
 
 def now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
\ No newline at end of file
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
\ No newline at end of file
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def write_tree(root: Path, files: dict[str, str]) -> None:
+    """
+    Write a tree of small text files under `root`.
+
+    `files` maps POSIX-style relative paths to their contents. Each parent
+    directory is created once, however many files it holds.
+    """
+    made: set[Path] = set()
+    for rel in sorted(files):
+        path = root / rel
+        if path.parent not in made:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            made.add(path.parent)
+        path.write_text(files[rel], encoding="utf-8")
@@ -1,10 +1,7 @@
-from typer.testing import CliRunner
-
 from bpm.cli.main import app as root_app
 
 
-def test_agent_config_non_interactive_writes_file(tmpdir, monkeypatch):
-    runner = CliRunner()
+def test_agent_config_non_interactive_writes_file(runner, tmpdir, monkeypatch):
     cfg_path = tmpdir / "agent.toml"
     monkeypatch.setenv("BPM_AGENT_CONFIG", str(cfg_path))
 
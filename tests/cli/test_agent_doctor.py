@@ -1,5 +1,3 @@
-from typer.testing import CliRunner
-
 from bpm.cli.main import app as root_app
 from bpm.core import store_registry as reg
 from bpm.core.agent_provider import HealthResult
@@ -27,9 +25,7 @@ def _mk_min_brs(tmpdir):
     return src
 
 
-def test_agent_doctor_success(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
+def test_agent_doctor_success(runner, tmpdir, monkeypatch):
     cfg_path = tmpdir / "agent.toml"
     monkeypatch.setenv("BPM_AGENT_CONFIG", str(cfg_path))
 
@@ -69,9 +65,7 @@ def test_agent_doctor_success(tmpdir, monkeypatch):
     assert "[ok] Active BRS templates discovered" in r.output
 
 
-def test_agent_doctor_fails_on_missing_model(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
+def test_agent_doctor_fails_on_missing_model(runner, tmpdir, monkeypatch):
     cfg_path = tmpdir / "agent.toml"
     monkeypatch.setenv("BPM_AGENT_CONFIG", str(cfg_path))
 
@@ -1,7 +1,5 @@
 import json
 
-from typer.testing import CliRunner
-
 from bpm.cli.main import app as root_app
 from bpm.core import store_registry as reg
 from bpm.core.agent_provider import HealthResult, ModelCheckResult
@@ -28,9 +26,7 @@ def _mk_min_brs(tmpdir):
     return src
 
 
-def test_history_lists_sessions(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
+def test_history_lists_sessions(runner, tmpdir, monkeypatch):
     monkeypatch.setenv("BPM_AGENT_SESSION_DIR", str(tmpdir / "sessions"))
     cfg_path = tmpdir / "agent.toml"
     monkeypatch.setenv("BPM_AGENT_CONFIG", str(cfg_path))
@@ -74,9 +70,7 @@ def test_history_lists_sessions(tmpdir, monkeypatch):
     assert "kind=start" in r3.output or "kind=doctor" in r3.output
 
 
-def test_history_json_and_filter(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
+def test_history_json_and_filter(runner, tmpdir, monkeypatch):
     monkeypatch.setenv("BPM_AGENT_SESSION_DIR", str(tmpdir / "sessions"))
 
     src = _mk_min_brs(tmpdir)
@@ -1,5 +1,3 @@
-from typer.testing import CliRunner
-
 from bpm.cli.main import app as root_app
 from bpm.core import store_registry as reg
 
@@ -91,10 +89,7 @@ def _mk_project(tmpdir):
     return pdir
 
 
-def test_agent_methods_stdout_and_outfile(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_agent_methods_stdout_and_outfile(runner, tmpdir):
     src = _mk_brs_with_methods(tmpdir)
     reg.add(str(src), activate=True)
     pdir = _mk_project(tmpdir)
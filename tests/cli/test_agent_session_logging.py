@@ -1,7 +1,5 @@
 import json
 
-from typer.testing import CliRunner
-
 from bpm.cli.main import app as root_app
 from bpm.core import store_registry as reg
 from bpm.core.agent_provider import HealthResult, ModelCheckResult
@@ -34,9 +32,7 @@ def _read_jsonl(path):
     return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
 
 
-def test_start_writes_session_log(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
+def test_start_writes_session_log(runner, tmpdir, monkeypatch):
     monkeypatch.setenv("BPM_AGENT_SESSION_DIR", str(tmpdir / "sessions"))
 
     src = _mk_min_brs(tmpdir)
@@ -56,9 +52,7 @@ def test_start_writes_session_log(tmpdir, monkeypatch):
     assert "start_end" in names
 
 
-def test_doctor_writes_session_log(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
+def test_doctor_writes_session_log(runner, tmpdir, monkeypatch):
     monkeypatch.setenv("BPM_AGENT_SESSION_DIR", str(tmpdir / "sessions"))
     cfg_path = tmpdir / "agent.toml"
     monkeypatch.setenv("BPM_AGENT_CONFIG", str(cfg_path))
@@ -1,5 +1,3 @@
-from typer.testing import CliRunner
-
 from bpm.cli.main import app as root_app
 from bpm.core import store_registry as reg
 from bpm.core.agent_config import AgentConfig
@@ -58,10 +56,7 @@ def _mk_min_brs(tmpdir):
     return src
 
 
-def test_agent_start_chat_mode(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_agent_start_chat_mode(runner, tmpdir, monkeypatch):
     src = _mk_min_brs(tmpdir)
     reg.add(str(src), activate=True)
 
@@ -106,10 +101,7 @@ def test_agent_start_chat_mode(tmpdir, monkeypatch):
     assert "Session ended." in r.output
 
 
-def test_agent_start_chat_includes_template_and_run_hints(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_agent_start_chat_includes_template_and_run_hints(runner, tmpdir, monkeypatch):
     src = _mk_min_brs(tmpdir)
     reg.add(str(src), activate=True)
 
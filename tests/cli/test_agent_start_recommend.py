@@ -1,5 +1,3 @@
-from typer.testing import CliRunner
-
 from bpm.cli.main import app as root_app
 from bpm.core import store_registry as reg
 
@@ -56,10 +54,7 @@ def _mk_ambiguous_brs(tmpdir):
     return src
 
 
-def test_agent_start_recommendation(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_agent_start_recommendation(runner, tmpdir):
     src = _mk_min_brs(tmpdir)
     reg.add(str(src), activate=True)
 
@@ -75,10 +70,7 @@ def test_agent_start_recommendation(tmpdir, monkeypatch):
     assert "bpm template render illumina_methylation_process" in r.output
 
 
-def test_agent_start_confirmation_no(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_agent_start_confirmation_no(runner, tmpdir):
     src = _mk_min_brs(tmpdir)
     reg.add(str(src), activate=True)
 
@@ -92,10 +84,7 @@ def test_agent_start_confirmation_no(tmpdir, monkeypatch):
     assert "Cancelled." in r.output
 
 
-def test_agent_start_adaptive_questions_only_when_ambiguous(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_agent_start_adaptive_questions_only_when_ambiguous(runner, tmpdir):
     src = _mk_ambiguous_brs(tmpdir)
     reg.add(str(src), activate=True)
 
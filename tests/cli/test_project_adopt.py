@@ -1,43 +1,37 @@
-from typer.testing import CliRunner
 from pathlib import Path
 
 from bpm.core import store_registry as reg
 from bpm.cli.main import app as root_app
 from bpm.core.project_io import load as load_project
+from tests.cli._fixtures import write_tree
 
 
 def _mk_brs(tmpdir):
     src = tmpdir / "brs"
-    (src / "config").mkdir(parents=True)
-    (src / "templates" / "hello").mkdir(parents=True)
-    (src / "repo.yaml").write_text(
-        "id: demo-brs\nname: Demo\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n"
-    )
-    (src / "config" / "settings.yaml").write_text("schema_version: 1\n")
-    (src / "config" / "authors.yaml").write_text("authors: []\n")
-
-    (src / "templates" / "hello" / "template.config.yaml").write_text(
-        "id: hello\n"
-        "description: Demo\n"
-        "params: {}\n"
-        "render:\n"
-        "  into: '.'\n"
-        "  files:\n"
-        "    - run.sh.j2 -> run.sh\n"
-        "run:\n"
-        "  entry: \"run.sh\"\n"
-    )
-    (src / "templates" / "hello" / "run.sh.j2").write_text(
-        "#!/usr/bin/env bash\n"
-        "echo ok > marker\n"
-    )
+    write_tree(src, {
+        "repo.yaml": "id: demo-brs\nname: Demo\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n",
+        "config/settings.yaml": "schema_version: 1\n",
+        "config/authors.yaml": "authors: []\n",
+        "templates/hello/template.config.yaml": (
+            "id: hello\n"
+            "description: Demo\n"
+            "params: {}\n"
+            "render:\n"
+            "  into: '.'\n"
+            "  files:\n"
+            "    - run.sh.j2 -> run.sh\n"
+            "run:\n"
+            "  entry: \"run.sh\"\n"
+        ),
+        "templates/hello/run.sh.j2": (
+            "#!/usr/bin/env bash\n"
+            "echo ok > marker\n"
+        ),
+    })
     return src
 
 
-def test_project_adopt_and_init_with_adopt(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_project_adopt_and_init_with_adopt(runner, tmpdir):
     src = _mk_brs(tmpdir)
     reg.add(str(src), activate=True)
 
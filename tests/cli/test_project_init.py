@@ -1,5 +1,4 @@
 from pathlib import Path
-from typer.testing import CliRunner
 
 from bpm.core import store_registry as reg
 from bpm.core import env
@@ -31,10 +30,7 @@ def _mk_min_brs(tmpdir):
     return src
 
 
-def test_project_init_happy_path(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_project_init_happy_path(runner, tmpdir):
     # minimal BRS
     src = _mk_min_brs(tmpdir)
     reg.add(str(src), activate=True)
@@ -58,9 +54,7 @@ def test_project_init_happy_path(tmpdir, monkeypatch):
     assert [a["id"] for a in data["authors"]] == ["ckuo", "lgan"]
 
 
-def test_project_init_rejects_bad_name(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
+def test_project_init_rejects_bad_name(runner, tmpdir):
     src = _mk_min_brs(tmpdir)
     reg.add(str(src), activate=True)
 
@@ -1,5 +1,3 @@
-from typer.testing import CliRunner
-
 from bpm.cli.main import app as root_app
 from bpm.core.project_io import load as load_project, save as save_project
 
@@ -37,8 +35,7 @@ def _write_project(tmpdir):
     return project_dir
 
 
-def test_project_rm_template_dry_run(tmpdir):
-    runner = CliRunner()
+def test_project_rm_template_dry_run(runner, tmpdir):
     project_dir = _write_project(tmpdir)
 
     result = runner.invoke(root_app, ["project", "rm-template", "alpha", "--dir", str(project_dir), "--dry-run", "--force"])
@@ -51,8 +48,7 @@ def test_project_rm_template_dry_run(tmpdir):
     assert (project_dir / "alpha").exists()
 
 
-def test_project_rm_template_removes_entry_and_directory(tmpdir):
-    runner = CliRunner()
+def test_project_rm_template_removes_entry_and_directory(runner, tmpdir):
     project_dir = _write_project(tmpdir)
 
     result = runner.invoke(root_app, ["project", "rm-template", "alpha", "--dir", str(project_dir), "--force"])
@@ -64,8 +60,7 @@ def test_project_rm_template_removes_entry_and_directory(tmpdir):
     assert not (project_dir / "alpha").exists()
 
 
-def test_project_rm_template_blocks_when_referenced_without_force(tmpdir):
-    runner = CliRunner()
+def test_project_rm_template_blocks_when_referenced_without_force(runner, tmpdir):
     project_dir = _write_project(tmpdir)
 
     result = runner.invoke(root_app, ["project", "rm-template", "alpha", "--dir", str(project_dir)])
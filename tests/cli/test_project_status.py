@@ -1,5 +1,4 @@
 from pathlib import Path
-from typer.testing import CliRunner
 
 from bpm.core import store_registry as reg
 from bpm.core import env
@@ -7,10 +6,7 @@ from bpm.cli.project import app as project_app
 from bpm.core.project_io import load as load_project
 
 
-def test_project_info_and_status(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_project_info_and_status(runner, tmpdir):
     # build minimal BRS
     src = tmpdir / "brs"
     (src / "config").mkdir(parents=True)
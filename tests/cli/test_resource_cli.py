@@ -1,5 +1,4 @@
 from pathlib import Path
-from typer.testing import CliRunner
 
 from bpm.cli.main import app as root_app
 from bpm.core import store_registry as reg
@@ -26,10 +25,7 @@ def _load_stores_yaml(tmpdir) -> dict:
     return safe_load_yaml(p)
 
 
-def test_resource_add_list_activate_remove(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_resource_add_list_activate_remove(runner, tmpdir):
     # two local BRS dirs
     brs1 = _mk_brs(tmpdir, "brs_one")
     brs2 = _mk_brs(tmpdir, "brs_two")
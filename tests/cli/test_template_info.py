@@ -1,5 +1,3 @@
-from typer.testing import CliRunner
-
 from bpm.core import store_registry as reg
 from bpm.cli.main import app as root_app
 
@@ -33,10 +31,7 @@ def _mk_brs_with_params(tmpdir):
     return src
 
 
-def test_template_info_json(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_template_info_json(runner, tmpdir):
     src = _mk_brs_with_params(tmpdir)
     reg.add(str(src), activate=True)
 
@@ -1,75 +1,63 @@
 from pathlib import Path
-from typer.testing import CliRunner
 
 from bpm.core import store_registry as reg
 from bpm.cli.main import app as root_app
 from bpm.core.project_io import load as load_project
+from tests.cli._fixtures import write_tree
 
 
 def _mk_brs_with_template(tmpdir):
     src = tmpdir / "brs"
-    (src / "config").mkdir(parents=True)
-    (src / "templates" / "hello").mkdir(parents=True)
-    (src / "repo.yaml").write_text(
-        "id: demo-brs\nname: Demo\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n"
-    )
-    (src / "config" / "settings.yaml").write_text(
-        "schema_version: 1\n"
-        "policy:\n"
-        "  project_name:\n"
-        "    example: \"250901_Tumor_RNAseq_UKA\"\n"
-        "    regex: '^\\d{6}_[A-Za-z0-9]+(?:_[A-Za-z0-9]+)*$'\n"
-        "    message: \"Use YYMMDD_Parts_Separated_By_Underscores\"\n"
-    )
-    (src / "config" / "authors.yaml").write_text("authors: []\n")
-
-    (src / "templates" / "hello" / "template.config.yaml").write_text(
-        "id: hello\n"
-        "description: Demo\n"
-        "params:\n"
-        "  name: {type: str, required: true}\n"
-        "render:\n"
-        "  into: \"${ctx.project.name}/${ctx.template.id}/\"\n"
-        "  files:\n"
-        "    - out.txt.j2 -> out.txt\n"
-        "run:\n"
-        "  entry: \"run.sh\"\n"
-    )
-    (src / "templates" / "hello" / "out.txt.j2").write_text(
-        "Hello {{ ctx.params.name }}\n"
-    )
+    write_tree(src, {
+        "repo.yaml": "id: demo-brs\nname: Demo\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n",
+        "config/settings.yaml": (
+            "schema_version: 1\n"
+            "policy:\n"
+            "  project_name:\n"
+            "    example: \"250901_Tumor_RNAseq_UKA\"\n"
+            "    regex: '^\\d{6}_[A-Za-z0-9]+(?:_[A-Za-z0-9]+)*$'\n"
+            "    message: \"Use YYMMDD_Parts_Separated_By_Underscores\"\n"
+        ),
+        "config/authors.yaml": "authors: []\n",
+        "templates/hello/template.config.yaml": (
+            "id: hello\n"
+            "description: Demo\n"
+            "params:\n"
+            "  name: {type: str, required: true}\n"
+            "render:\n"
+            "  into: \"${ctx.project.name}/${ctx.template.id}/\"\n"
+            "  files:\n"
+            "    - out.txt.j2 -> out.txt\n"
+            "run:\n"
+            "  entry: \"run.sh\"\n"
+        ),
+        "templates/hello/out.txt.j2": "Hello {{ ctx.params.name }}\n",
+    })
     return src
 
 
 def _mk_brs_with_path_param(tmpdir):
     src = tmpdir / "brs_path"
-    (src / "config").mkdir(parents=True)
-    (src / "templates" / "pathy").mkdir(parents=True)
-    (src / "repo.yaml").write_text(
-        "id: demo-path\nname: Demo Path\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n"
-    )
-    (src / "config" / "settings.yaml").write_text(
-        "schema_version: 1\n"
-    )
-    (src / "config" / "authors.yaml").write_text("authors: []\n")
-    (src / "templates" / "pathy" / "template.config.yaml").write_text(
-        "id: pathy\n"
-        "description: Demo path param\n"
-        "params:\n"
-        "  datadir: {type: str, required: true, exists: dir}\n"
-        "render:\n"
-        "  into: \"${ctx.project.name}/${ctx.template.id}/\"\n"
-        "  files:\n"
-        "    - run.sh.j2 -> run.sh\n"
-    )
-    (src / "templates" / "pathy" / "run.sh.j2").write_text("#!/usr/bin/env bash\nexit 0\n")
+    write_tree(src, {
+        "repo.yaml": "id: demo-path\nname: Demo Path\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n",
+        "config/settings.yaml": "schema_version: 1\n",
+        "config/authors.yaml": "authors: []\n",
+        "templates/pathy/template.config.yaml": (
+            "id: pathy\n"
+            "description: Demo path param\n"
+            "params:\n"
+            "  datadir: {type: str, required: true, exists: dir}\n"
+            "render:\n"
+            "  into: \"${ctx.project.name}/${ctx.template.id}/\"\n"
+            "  files:\n"
+            "    - run.sh.j2 -> run.sh\n"
+        ),
+        "templates/pathy/run.sh.j2": "#!/usr/bin/env bash\nexit 0\n",
+    })
     return src
 
 
-def test_template_render_writes_files_and_updates_project(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_template_render_writes_files_and_updates_project(runner, tmpdir):
     # BRS + activate
     src = _mk_brs_with_template(tmpdir)
     reg.add(str(src), activate=True)
@@ -95,8 +83,7 @@ def test_template_render_writes_files_and_updates_project(tmpdir, monkeypatch):
     assert t["params"]["name"] == "Alice"
 
 
-def test_template_render_hostifies_path_params(tmpdir, monkeypatch):
-    runner = CliRunner()
+def test_template_render_hostifies_path_params(runner, tmpdir, monkeypatch):
     base = Path(tmpdir)
     monkeypatch.setenv("BPM_CACHE", str(base / "cache2"))
 
@@ -132,8 +119,7 @@ def test_template_render_hostifies_path_params(tmpdir, monkeypatch):
     assert saved == expected
 
 
-def test_template_render_auto_detects_project_root_from_nested_cwd(tmpdir, monkeypatch):
-    runner = CliRunner()
+def test_template_render_auto_detects_project_root_from_nested_cwd(runner, tmpdir, monkeypatch):
     base = Path(tmpdir)
     monkeypatch.setenv("BPM_CACHE", str(base / "cache3"))
 
@@ -158,8 +144,7 @@ def test_template_render_auto_detects_project_root_from_nested_cwd(tmpdir, monke
     assert out.read_text().strip() == "Hello Alice"
 
 
-def test_template_render_help_hides_dir_option(tmpdir, monkeypatch):
-    runner = CliRunner()
+def test_template_render_help_hides_dir_option(runner, tmpdir, monkeypatch):
     monkeypatch.setenv("BPM_CACHE", str(Path(tmpdir) / "cache4"))
 
     r = runner.invoke(root_app, ["template", "render", "--help"])
@@ -1,44 +1,35 @@
 from pathlib import Path
-from typer.testing import CliRunner
 
 from bpm.core import store_registry as reg
 from bpm.cli.main import app as root_app
+from bpm.io.yamlio import safe_load_yaml
+from tests.cli._fixtures import write_tree
 
 
 def _mk_brs_with_template(tmpdir):
     src = tmpdir / "brs"
-    (src / "config").mkdir(parents=True)
-    (src / "templates" / "hello").mkdir(parents=True)
-    (src / "repo.yaml").write_text(
-        "id: demo-brs\nname: Demo\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n"
-    )
-    (src / "config" / "settings.yaml").write_text(
-        "schema_version: 1\n"
-    )
-    (src / "config" / "authors.yaml").write_text("authors: []\n")
-
-    (src / "templates" / "hello" / "template.config.yaml").write_text(
-        "id: hello\n"
-        "description: Demo\n"
-        "params:\n"
-        "  name: {type: str, required: true}\n"
-        "render:\n"
-        "  into: \"${ctx.project.name}/${ctx.template.id}/\"\n"
-        "  files:\n"
-        "    - out.txt.j2 -> out.txt\n"
-        "run:\n"
-        "  entry: \"run.sh\"\n"
-    )
-    (src / "templates" / "hello" / "out.txt.j2").write_text(
-        "Hello {{ ctx.params.name }}\n"
-    )
+    write_tree(src, {
+        "repo.yaml": "id: demo-brs\nname: Demo\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n",
+        "config/settings.yaml": "schema_version: 1\n",
+        "config/authors.yaml": "authors: []\n",
+        "templates/hello/template.config.yaml": (
+            "id: hello\n"
+            "description: Demo\n"
+            "params:\n"
+            "  name: {type: str, required: true}\n"
+            "render:\n"
+            "  into: \"${ctx.project.name}/${ctx.template.id}/\"\n"
+            "  files:\n"
+            "    - out.txt.j2 -> out.txt\n"
+            "run:\n"
+            "  entry: \"run.sh\"\n"
+        ),
+        "templates/hello/out.txt.j2": "Hello {{ ctx.params.name }}\n",
+    })
     return src
 
 
-def test_template_render_adhoc_writes_files_and_meta(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_template_render_adhoc_writes_files_and_meta(runner, tmpdir):
     # BRS + activate
     src = _mk_brs_with_template(tmpdir)
     reg.add(str(src), activate=True)
@@ -68,8 +59,8 @@ def test_template_render_adhoc_writes_files_and_meta(tmpdir, monkeypatch):
     # bpm.meta.yaml present with source + params
     meta_path = out_dir / "bpm.meta.yaml"
     assert meta_path.exists()
-    meta_text = meta_path.read_text()
-    assert "brs_id: demo-brs" in meta_text
-    assert "template_id: hello" in meta_text
-    assert "name: Alice" in meta_text
+    meta = safe_load_yaml(meta_path)
+    assert meta["source"]["brs_id"] == "demo-brs"
+    assert meta["source"]["template_id"] == "hello"
+    assert meta["params"]["name"] == "Alice"
 
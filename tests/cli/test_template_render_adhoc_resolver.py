@@ -1,59 +1,48 @@
 from pathlib import Path
-from typer.testing import CliRunner
 
 from bpm.core import store_registry as reg
 from bpm.cli.main import app as root_app
+from tests.cli._fixtures import write_tree
 
 
 def _mk_brs_with_resolver(tmpdir):
     src = tmpdir / "brs"
-    (src / "config").mkdir(parents=True)
-    (src / "templates" / "adhoc_tpl").mkdir(parents=True)
-    (src / "templates" / "plain_tpl").mkdir(parents=True)
-    (src / "resolvers").mkdir(parents=True)
-    (src / "repo.yaml").write_text(
-        "id: demo-brs\nname: Demo\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n"
-    )
-    (src / "config" / "settings.yaml").write_text("schema_version: 1\n")
-    (src / "config" / "authors.yaml").write_text("authors: []\n")
-
-    (src / "resolvers" / "out_from_bcl.py").write_text(
-        "from pathlib import Path\n\n"
-        "def main(ctx):\n"
-        "    bcl = ctx.params.get('bcl_dir', '')\n"
-        "    return Path(bcl).name\n"
-    )
-
-    (src / "templates" / "adhoc_tpl" / "template.config.yaml").write_text(
-        "id: adhoc_tpl\n"
-        "description: Demo with resolver\n"
-        "params:\n"
-        "  bcl_dir: {type: str, required: true}\n"
-        "render:\n"
-        "  adhoc_out_resolver: \"resolvers.out_from_bcl\"\n"
-        "  files:\n"
-        "    - out.txt.j2 -> out.txt\n"
-    )
-    (src / "templates" / "adhoc_tpl" / "out.txt.j2").write_text(
-        "BCL {{ ctx.params.bcl_dir }}\n"
-    )
-
-    (src / "templates" / "plain_tpl" / "template.config.yaml").write_text(
-        "id: plain_tpl\n"
-        "description: No resolver\n"
-        "params:\n"
-        "  name: {type: str, required: true}\n"
-        "render:\n"
-        "  files:\n"
-        "    - out.txt.j2 -> out.txt\n"
-    )
-    (src / "templates" / "plain_tpl" / "out.txt.j2").write_text("Hi {{ ctx.params.name }}\n")
+    write_tree(src, {
+        "repo.yaml": "id: demo-brs\nname: Demo\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n",
+        "config/settings.yaml": "schema_version: 1\n",
+        "config/authors.yaml": "authors: []\n",
+        "resolvers/out_from_bcl.py": (
+            "from pathlib import Path\n\n"
+            "def main(ctx):\n"
+            "    bcl = ctx.params.get('bcl_dir', '')\n"
+            "    return Path(bcl).name\n"
+        ),
+        "templates/adhoc_tpl/template.config.yaml": (
+            "id: adhoc_tpl\n"
+            "description: Demo with resolver\n"
+            "params:\n"
+            "  bcl_dir: {type: str, required: true}\n"
+            "render:\n"
+            "  adhoc_out_resolver: \"resolvers.out_from_bcl\"\n"
+            "  files:\n"
+            "    - out.txt.j2 -> out.txt\n"
+        ),
+        "templates/adhoc_tpl/out.txt.j2": "BCL {{ ctx.params.bcl_dir }}\n",
+        "templates/plain_tpl/template.config.yaml": (
+            "id: plain_tpl\n"
+            "description: No resolver\n"
+            "params:\n"
+            "  name: {type: str, required: true}\n"
+            "render:\n"
+            "  files:\n"
+            "    - out.txt.j2 -> out.txt\n"
+        ),
+        "templates/plain_tpl/out.txt.j2": "Hi {{ ctx.params.name }}\n",
+    })
     return src
 
 
-def test_template_render_adhoc_resolver_derives_out(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
+def test_template_render_adhoc_resolver_derives_out(runner, tmpdir, monkeypatch):
     monkeypatch.chdir(tmpdir)
     src = _mk_brs_with_resolver(tmpdir)
     reg.add(str(src), activate=True)
@@ -80,9 +69,7 @@ def test_template_render_adhoc_resolver_derives_out(tmpdir, monkeypatch):
     assert "BCL" in out_file.read_text()
 
 
-def test_template_render_adhoc_prefers_cli_out(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
+def test_template_render_adhoc_prefers_cli_out(runner, tmpdir, monkeypatch):
     monkeypatch.chdir(tmpdir)
     src = _mk_brs_with_resolver(tmpdir)
     reg.add(str(src), activate=True)
@@ -110,9 +97,7 @@ def test_template_render_adhoc_prefers_cli_out(tmpdir, monkeypatch):
     assert not (tmpdir / "230101_FC2").exists()
 
 
-def test_template_render_adhoc_requires_resolver_or_out(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
+def test_template_render_adhoc_requires_resolver_or_out(runner, tmpdir, monkeypatch):
     monkeypatch.chdir(tmpdir)
     src = _mk_brs_with_resolver(tmpdir)
     reg.add(str(src), activate=True)
@@ -1,50 +1,43 @@
-from typer.testing import CliRunner
-
 from bpm.core import store_registry as reg
 from bpm.cli.main import app as root_app
+from tests.cli._fixtures import write_tree
 
 
 def _mk_brs_with_workflow(tmpdir):
     src = tmpdir / "brs"
-    (src / "config").mkdir(parents=True)
-    (src / "workflows" / "demo").mkdir(parents=True)
-    (src / "repo.yaml").write_text(
-        "id: demo-brs\nname: Demo\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n"
-    )
-    (src / "config" / "settings.yaml").write_text("schema_version: 1\n")
-    (src / "config" / "authors.yaml").write_text("authors: []\n")
-
-    (src / "workflows" / "demo" / "workflow_config.yaml").write_text(
-        "id: demo\n"
-        "description: Demo Workflow\n"
-        "params:\n"
-        "  sample_id: {type: str, required: true, cli: --sample-id}\n"
-        "  threads: {type: int, required: false, default: 4}\n"
-        "run:\n"
-        "  entry: \"run.sh\"\n"
-        "  args:\n"
-        "    - \"${ctx.params.sample_id}\"\n"
-        "  env:\n"
-        "    REPORT_DIR: \"${ctx.project_dir}/reports\"\n"
-        "hooks:\n"
-        "  pre_run: [hooks.env:main]\n"
-        "  post_run: [hooks.collect:main]\n"
-        "tools:\n"
-        "  required: [python]\n"
-        "  optional: [quarto]\n"
-    )
-    (src / "workflows" / "demo" / "run.sh").write_text(
-        "#!/usr/bin/env bash\n"
-        "set -euo pipefail\n"
-        "echo \"$1\"\n"
-    )
+    write_tree(src, {
+        "repo.yaml": "id: demo-brs\nname: Demo\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n",
+        "config/settings.yaml": "schema_version: 1\n",
+        "config/authors.yaml": "authors: []\n",
+        "workflows/demo/workflow_config.yaml": (
+            "id: demo\n"
+            "description: Demo Workflow\n"
+            "params:\n"
+            "  sample_id: {type: str, required: true, cli: --sample-id}\n"
+            "  threads: {type: int, required: false, default: 4}\n"
+            "run:\n"
+            "  entry: \"run.sh\"\n"
+            "  args:\n"
+            "    - \"${ctx.params.sample_id}\"\n"
+            "  env:\n"
+            "    REPORT_DIR: \"${ctx.project_dir}/reports\"\n"
+            "hooks:\n"
+            "  pre_run: [hooks.env:main]\n"
+            "  post_run: [hooks.collect:main]\n"
+            "tools:\n"
+            "  required: [python]\n"
+            "  optional: [quarto]\n"
+        ),
+        "workflows/demo/run.sh": (
+            "#!/usr/bin/env bash\n"
+            "set -euo pipefail\n"
+            "echo \"$1\"\n"
+        ),
+    })
     return src
 
 
-def test_workflow_info_json(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_workflow_info_json(runner, tmpdir):
     src = _mk_brs_with_workflow(tmpdir)
     reg.add(str(src), activate=True)
 
@@ -64,10 +57,7 @@ def test_workflow_info_json(tmpdir, monkeypatch):
     assert "python" in data.get("tools", {}).get("required", [])
 
 
-def test_workflow_info_plain_and_table(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_workflow_info_plain_and_table(runner, tmpdir):
     src = _mk_brs_with_workflow(tmpdir)
     reg.add(str(src), activate=True)
 
@@ -1,47 +1,39 @@
 from pathlib import Path
-from typer.testing import CliRunner
 
 from bpm.core import store_registry as reg
 from bpm.core.project_io import load as load_project
 from bpm.cli.main import app as root_app
+from tests.cli._fixtures import write_tree
 
 
 def _mk_brs_with_workflow(tmpdir):
     src = tmpdir / "brs"
-    (src / "config").mkdir(parents=True)
-    (src / "workflows" / "clean").mkdir(parents=True)
-    (src / "repo.yaml").write_text(
-        "id: demo-brs\nname: Demo\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n"
-    )
-    (src / "config" / "settings.yaml").write_text(
-        "schema_version: 1\n"
-    )
-    (src / "config" / "authors.yaml").write_text("authors: []\n")
-
-    (src / "workflows" / "clean" / "workflow_config.yaml").write_text(
-        "id: clean\n"
-        "description: Demo workflow\n"
-        "params:\n"
-        "  name: {type: str, required: true, cli: --name}\n"
-        "run:\n"
-        "  entry: \"run.sh\"\n"
-        "  args:\n"
-        "    - \"${ctx.params.name}\"\n"
-    )
-    (src / "workflows" / "clean" / "run.sh").write_text(
-        "#!/usr/bin/env bash\n"
-        "set -euo pipefail\n"
-        "name=\"$1\"\n"
-        "out=\"${BPM_PROJECT_DIR}/wf_ran.txt\"\n"
-        "echo \"WF Hello ${name}\" > \"${out}\"\n"
-    )
+    write_tree(src, {
+        "repo.yaml": "id: demo-brs\nname: Demo\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n",
+        "config/settings.yaml": "schema_version: 1\n",
+        "config/authors.yaml": "authors: []\n",
+        "workflows/clean/workflow_config.yaml": (
+            "id: clean\n"
+            "description: Demo workflow\n"
+            "params:\n"
+            "  name: {type: str, required: true, cli: --name}\n"
+            "run:\n"
+            "  entry: \"run.sh\"\n"
+            "  args:\n"
+            "    - \"${ctx.params.name}\"\n"
+        ),
+        "workflows/clean/run.sh": (
+            "#!/usr/bin/env bash\n"
+            "set -euo pipefail\n"
+            "name=\"$1\"\n"
+            "out=\"${BPM_PROJECT_DIR}/wf_ran.txt\"\n"
+            "echo \"WF Hello ${name}\" > \"${out}\"\n"
+        ),
+    })
     return src
 
 
-def test_workflow_run(tmpdir, monkeypatch):
-    runner = CliRunner()
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_workflow_run(runner, tmpdir):
     # BRS + activate
     src = _mk_brs_with_workflow(tmpdir)
     reg.add(str(src), activate=True)
@@ -1,16 +1,22 @@
-import os
-import shutil
-import tempfile
-from pathlib import Path
 import pytest
+from typer.testing import CliRunner
 
 @pytest.fixture()
-def tmpdir():
-    d = Path(tempfile.mkdtemp(prefix="bpm-day1-"))
-    try:
-        yield d
-    finally:
-        shutil.rmtree(d, ignore_errors=True)
+def tmpdir(tmp_path):
+    # pytest's tmp_path, under the name the suite already uses; old base
+    # directories are pruned per run instead of rmtree'd after every test
+    return tmp_path
+
+@pytest.fixture(autouse=True)
+def _bpm_cache(monkeypatch, tmpdir):
+    # every test gets its own BPM cache; tests that need another location
+    # simply setenv again
+    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
+
+@pytest.fixture(scope="session")
+def runner():
+    # CliRunner keeps no per-invoke state, so one instance serves every test
+    return CliRunner()
 
 @pytest.fixture()
 def hosts_cfg():
@@ -0,0 +1,30 @@
+from pathlib import Path
+
+from bpm.core import agent_template_index as idx
+from bpm.core import store_registry as reg
+
+
+def test_list_templates_detects_descriptors(tmpdir):
+    src = Path(tmpdir) / "brs"
+    tdir = src / "templates"
+    (tdir / "new").mkdir(parents=True)
+    (src / "repo.yaml").write_text(
+        "id: demo-brs\nname: Demo\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n"
+    )
+    (tdir / "new" / "template_config.yaml").write_text("id: new\n")
+    (tdir / "legacy").mkdir()
+    (tdir / "legacy" / "template.config.yaml").write_text("id: legacy\n")
+    (tdir / "both").mkdir()
+    (tdir / "both" / "template_config.yaml").write_text("id: both\n")
+    (tdir / "both" / "template.config.yaml").write_text("id: both\n")
+    (tdir / "empty").mkdir()
+    (tdir / "README.md").write_text("not a template\n")
+    rec = reg.add(str(src), activate=True)
+
+    entries = idx.list_templates()
+
+    assert [e.template_id for e in entries] == ["both", "legacy", "new"]
+    by_id = {e.template_id: e.descriptor_path for e in entries}
+    cached = Path(rec.cache_path) / "templates"
+    assert by_id["both"] == cached / "both" / "template_config.yaml"
+    assert by_id["legacy"] == cached / "legacy" / "template.config.yaml"
@@ -3,11 +3,7 @@ from bpm.core import store_registry as reg
 from bpm.core import brs_loader as brs
 from bpm.core import env
 
-def test_brs_loader_reads_active_store(tmpdir, monkeypatch):
-    # isolate cache
-    cache = tmpdir / "cache"
-    monkeypatch.setenv("BPM_CACHE", str(cache))
-
+def test_brs_loader_reads_active_store(tmpdir):
     # prepare minimal BRS on disk
     src = tmpdir / "brs_min"
     (src / "config").mkdir(parents=True)
@@ -74,4 +70,18 @@ def test_brs_loader_reads_active_store(tmpdir, monkeypatch):
     # template presence
     assert brs.template_exists("hello", root)
     desc_path = brs.template_descriptor_path("hello", root)
-    assert desc_path.exists()
\ No newline at end of file
+    assert desc_path.exists()
+
+def test_active_brs_path_follows_activate(tmpdir):
+    for brs_id in ("brs-a", "brs-b"):
+        src = tmpdir / brs_id
+        (src / "config").mkdir(parents=True)
+        (src / "repo.yaml").write_text(
+            f"id: {brs_id}\nname: X\ndescription: X\nversion: 0.0.1\nmaintainer: T <t@e>\n"
+        )
+        reg.add(str(src))
+
+    reg.activate("brs-a")
+    assert brs.get_active_brs_path().name == "brs-a"
+    reg.activate("brs-b")
+    assert brs.get_active_brs_path().name == "brs-b"
@@ -3,9 +3,7 @@ from bpm.core import store_registry as reg, env
 from bpm.core import brs_loader as brs
 from bpm.core import descriptor_loader as dl
 
-def test_descriptor_loads_minimal(tmpdir, monkeypatch):
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_descriptor_loads_minimal(tmpdir):
     # minimal BRS with one template
     src = tmpdir / "brs"
     (src / "templates" / "hello").mkdir(parents=True)
@@ -38,8 +36,7 @@ def test_descriptor_loads_minimal(tmpdir, monkeypatch):
     assert "name" in d.params
     assert d.params["name"].required is True
 
-def test_descriptor_id_mismatch_raises(tmpdir, monkeypatch):
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
+def test_descriptor_id_mismatch_raises(tmpdir):
     src = tmpdir / "brs"
     (src / "templates" / "X").mkdir(parents=True)
     (src / "config").mkdir()
@@ -2,9 +2,7 @@ from bpm.core import store_registry as reg
 from bpm.core import descriptor_loader as dl
 
 
-def test_descriptor_tools_parsing(tmpdir, monkeypatch):
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_descriptor_tools_parsing(tmpdir):
     src = tmpdir / "brs"
     (src / "templates" / "hello").mkdir(parents=True)
     (src / "config").mkdir()
@@ -28,9 +26,7 @@ def test_descriptor_tools_parsing(tmpdir, monkeypatch):
     assert d.tools_optional == ["bcl-convert"]
 
 
-def test_descriptor_tools_list_as_required(tmpdir, monkeypatch):
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_descriptor_tools_list_as_required(tmpdir):
     src = tmpdir / "brs"
     (src / "templates" / "hello").mkdir(parents=True)
     (src / "config").mkdir()
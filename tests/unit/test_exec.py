@@ -2,7 +2,7 @@ import os
 from pathlib import Path
 import pytest
 
-from bpm.io.exec import run_process, ProcessError
+from bpm.io.exec import run_process, ProcessError, which
 
 
 def test_run_process_raises_on_nonzero(tmpdir, monkeypatch):
@@ -14,3 +14,15 @@ def test_run_process_raises_on_nonzero(tmpdir, monkeypatch):
     with pytest.raises(ProcessError):
         run_process(["./fail.sh"], cwd=Path(tmpdir))
 
+
+def test_which_is_keyed_on_path(tmpdir, monkeypatch):
+    bindir = Path(tmpdir) / "bin"
+    bindir.mkdir()
+    tool = bindir / "bpm-fake-tool"
+    tool.write_text("#!/bin/sh\n")
+    os.chmod(tool, 0o755)
+
+    monkeypatch.setenv("PATH", str(Path(tmpdir) / "empty"))
+    assert which("bpm-fake-tool") is None
+    monkeypatch.setenv("PATH", str(bindir))
+    assert which("bpm-fake-tool") == str(tool)
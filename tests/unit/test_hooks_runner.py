@@ -1,16 +1,17 @@
+import importlib
+import os
 from pathlib import Path
 from typer.testing import CliRunner
 
 from bpm.core import store_registry as reg
 from bpm.core import brs_loader
+from bpm.core import hooks_runner
 from bpm.core.context import build as build_ctx
 from bpm.core.descriptor_loader import Descriptor  # for minimal fake desc
 from bpm.core.hooks_runner import run as run_hooks
 
 
-def test_hooks_runner_executes_in_order(tmpdir, monkeypatch):
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_hooks_runner_executes_in_order(tmpdir):
     src = tmpdir / "brs"
     src.mkdir(parents=True, exist_ok=True)          # <-- add this line
 
@@ -37,4 +38,40 @@ def test_hooks_runner_executes_in_order(tmpdir, monkeypatch):
 
     out = tmpdir / "hook_was_here.txt"
     assert out.exists()
-    assert out.read_text() == "ok"
\ No newline at end of file
+    assert out.read_text() == "ok"
+
+
+def test_hooks_runner_reuses_and_reloads_edited_hook(tmpdir, monkeypatch):
+    src = tmpdir / "brs"
+    (src / "hooks").mkdir(parents=True)
+    (src / "repo.yaml").write_text(
+        "id: demo-brs\nname: Demo\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n"
+    )
+    (src / "hooks" / "__init__.py").write_text("")
+    (src / "hooks" / "common.py").write_text("VALUE = 1\n")
+    # answer.py stays untouched; only the helper it imports is edited below
+    (src / "hooks" / "answer.py").write_text(
+        "from hooks.common import VALUE\n\ndef main(ctx):\n    return VALUE\n"
+    )
+    rec = reg.add(str(src), activate=True)
+
+    imported = []
+    real_import = importlib.import_module
+
+    def spy(name, *args, **kwargs):
+        imported.append(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(hooks_runner.importlib, "import_module", spy)
+
+    ctx = build_ctx(None, "hello", {}, {"repo": {}, "authors": {}, "hosts": {}, "settings": {}}, tmpdir)
+    assert run_hooks(["hooks.answer"], ctx) == [("hooks.answer", 1)]
+    assert run_hooks(["hooks.answer"], ctx) == [("hooks.answer", 1)]
+    assert imported == ["hooks.answer"]
+
+    helper = Path(rec.cache_path) / "hooks" / "common.py"
+    helper.write_text("VALUE = 22\n")
+    st = helper.stat()
+    os.utime(helper, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+    assert run_hooks(["hooks.answer"], ctx) == [("hooks.answer", 22)]
+    assert imported == ["hooks.answer", "hooks.answer"]
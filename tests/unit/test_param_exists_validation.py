@@ -4,7 +4,7 @@ import pytest
 from bpm.core.template_service import render as svc_render
 
 
-def test_param_exists_dir_validation(tmpdir, monkeypatch):
+def test_param_exists_dir_validation(tmpdir):
     # Build an in-memory descriptor pointing to a temp template folder
     tpl_id = "x"
     tpl_root = tmpdir / "brs" / "templates" / tpl_id
@@ -14,7 +14,6 @@ def test_param_exists_dir_validation(tmpdir, monkeypatch):
     (tmpdir / "brs" / "repo.yaml").write_text("id: t\nname: T\ndescription: d\nversion: 0.0.1\nmaintainer: t@e\n")
     (tmpdir / "brs" / "config" / "settings.yaml").write_text("schema_version: 1\n")
     (tmpdir / "brs" / "config" / "authors.yaml").write_text("authors: []\n")
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
     # point active BRS to tmp brs
     from bpm.core import store_registry as reg
     rec = reg.add(str(tmpdir / "brs"), activate=True)
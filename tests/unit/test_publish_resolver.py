@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 from bpm.core import store_registry as reg
@@ -5,9 +6,7 @@ from bpm.core.context import build as build_ctx
 from bpm.core.publish_resolver import resolve_all
 
 
-def test_publish_resolver_updates_project(tmpdir, monkeypatch):
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_publish_resolver_updates_project(tmpdir):
     src = tmpdir / "brs"
     src.mkdir(parents=True, exist_ok=True)          # <-- add this line
 
@@ -49,9 +48,7 @@ def test_publish_resolver_updates_project(tmpdir, monkeypatch):
     assert templates[0]["published"]["greeting"] == "Hello hello from P"
 
 
-def test_publish_resolver_with_args(tmpdir, monkeypatch):
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_publish_resolver_with_args(tmpdir):
     src = tmpdir / "brs"
     src.mkdir(parents=True, exist_ok=True)          # <-- add this line
 
@@ -74,4 +71,55 @@ def test_publish_resolver_with_args(tmpdir, monkeypatch):
         "meta": {"resolver": "resolvers.kv", "args": {"key": "a", "value": "b"}}
     }
     out = resolve_all(publish_cfg, ctx, project)
-    assert out["meta"] == {"a": "b"}
\ No newline at end of file
+    assert out["meta"] == {"a": "b"}
+
+
+def test_publish_resolver_reloads_edited_reexporting_module(tmpdir):
+    src = tmpdir / "brs"
+    (src / "resolvers").mkdir(parents=True)
+    (src / "repo.yaml").write_text(
+        "id: demo-brs\nname: Demo\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n"
+    )
+    (src / "resolvers" / "__init__.py").write_text("")
+    (src / "resolvers" / "common.py").write_text("def main(ctx):\n    return 1\n")
+    # pub.py only re-exports; its own edits must still be picked up
+    (src / "resolvers" / "pub.py").write_text("from resolvers.common import main\n")
+    rec = reg.add(str(src), activate=True)
+
+    project = {"name": "P", "project_path": "nextgen:/P", "templates": []}
+    ctx = build_ctx(project, "hello", {}, {"repo": {}, "authors": {}, "hosts": {}, "settings": {}}, tmpdir)
+    publish_cfg = {"n": {"resolver": "resolvers.pub"}}
+    assert resolve_all(publish_cfg, ctx, project)["n"] == 1
+    assert resolve_all(publish_cfg, ctx, project)["n"] == 1
+
+    pub = Path(rec.cache_path) / "resolvers" / "pub.py"
+    pub.write_text("def main(ctx):\n    return 2\n")
+    st = pub.stat()
+    os.utime(pub, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+    assert resolve_all(publish_cfg, ctx, project)["n"] == 2
+
+
+def test_publish_resolver_reloads_edited_helper(tmpdir):
+    src = tmpdir / "brs"
+    (src / "resolvers").mkdir(parents=True)
+    (src / "repo.yaml").write_text(
+        "id: demo-brs\nname: Demo\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n"
+    )
+    (src / "resolvers" / "__init__.py").write_text("")
+    (src / "resolvers" / "common.py").write_text("VALUE = 'old'\n")
+    # pub.py stays untouched; only the helper it imports is edited below
+    (src / "resolvers" / "pub.py").write_text(
+        "from resolvers.common import VALUE\n\ndef main(ctx):\n    return VALUE\n"
+    )
+    rec = reg.add(str(src), activate=True)
+
+    project = {"name": "P", "project_path": "nextgen:/P", "templates": []}
+    ctx = build_ctx(project, "hello", {}, {"repo": {}, "authors": {}, "hosts": {}, "settings": {}}, tmpdir)
+    publish_cfg = {"v": {"resolver": "resolvers.pub"}}
+    assert resolve_all(publish_cfg, ctx, project)["v"] == "old"
+
+    helper = Path(rec.cache_path) / "resolvers" / "common.py"
+    helper.write_text("VALUE = 'new'\n")
+    st = helper.stat()
+    os.utime(helper, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+    assert resolve_all(publish_cfg, ctx, project)["v"] == "new"
@@ -1,5 +1,8 @@
 from pathlib import Path
 
+import pytest
+from jinja2.exceptions import UndefinedError
+
 from bpm.core import store_registry as reg
 from bpm.core import env, brs_loader
 from bpm.core.descriptor_loader import load as load_desc
@@ -7,10 +10,7 @@ from bpm.core.context import build as build_ctx
 from bpm.core.jinja_renderer import render
 
 
-def test_renderer_renders_and_sets_executable(tmpdir, monkeypatch):
-    # isolate cache
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
-
+def test_renderer_renders_and_sets_executable(tmpdir):
     # prepare a minimal BRS with hello template
     src = tmpdir / "brs"
     (src / "config").mkdir(parents=True)
@@ -66,8 +66,7 @@ def test_renderer_renders_and_sets_executable(tmpdir, monkeypatch):
     assert (run.stat().st_mode & 0o111) != 0
 
 
-def test_renderer_missing_template_raises(tmpdir, monkeypatch):
-    monkeypatch.setenv("BPM_CACHE", str(tmpdir / "cache"))
+def test_renderer_missing_template_raises(tmpdir):
     src = tmpdir / "brs"
     (src / "config").mkdir(parents=True)
     (src / "templates" / "hello").mkdir(parents=True)
@@ -96,4 +95,96 @@ def test_renderer_missing_template_raises(tmpdir, monkeypatch):
         render(desc, ctx, dry=False)
         assert False, "Expected FileNotFoundError"
     except FileNotFoundError as e:
-        assert "Template not found" in str(e)
\ No newline at end of file
+        assert "Template not found" in str(e)
+
+def test_renderer_picks_up_edited_template(tmpdir):
+    import os
+
+    src = tmpdir / "brs"
+    (src / "config").mkdir(parents=True)
+    (src / "templates" / "hello").mkdir(parents=True)
+    (src / "repo.yaml").write_text(
+        "id: demo-brs\nname: Demo\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n"
+    )
+    (src / "templates" / "hello" / "template.config.yaml").write_text(
+        "id: hello\n"
+        "render:\n"
+        "  into: \"out/\"\n"
+        "  files:\n"
+        "    - greet.txt.j2 -> greet.txt\n"
+    )
+    (src / "templates" / "hello" / "greet.txt.j2").write_text("v1 {{ ctx.params.name }}\n")
+    rec = reg.add(str(src), activate=True)
+
+    desc = load_desc("hello")
+    brs_cfg = {"repo": {}, "authors": {}, "hosts": {}, "settings": {}}
+    ctx = build_ctx(None, desc.id, {"name": "Alice"}, brs_cfg, tmpdir)
+    render(desc, ctx)
+    assert (tmpdir / "out" / "greet.txt").read_text() == "v1 Alice\n"
+
+    cached = Path(rec.cache_path) / "templates" / "hello" / "greet.txt.j2"
+    cached.write_text("v2 {{ ctx.params.name }}\n")
+    st = cached.stat()
+    os.utime(cached, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+    render(desc, ctx)
+    assert (tmpdir / "out" / "greet.txt").read_text() == "v2 Alice\n"
+
+
+def test_renderer_creates_nested_destination_dirs(tmpdir):
+    src = tmpdir / "brs"
+    (src / "config").mkdir(parents=True)
+    (src / "templates" / "nested").mkdir(parents=True)
+    (src / "repo.yaml").write_text(
+        "id: demo-brs\nname: Demo\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n"
+    )
+    (src / "templates" / "nested" / "template.config.yaml").write_text(
+        "id: nested\n"
+        "render:\n"
+        "  into: \"out/\"\n"
+        "  files:\n"
+        "    - a.txt.j2 -> sub/a.txt\n"
+        "    - b.txt -> sub/deeper/b.txt\n"
+        "    - c.txt -> sub/c.txt\n"
+    )
+    (src / "templates" / "nested" / "a.txt.j2").write_text("{{ ctx.template.id }}\n")
+    (src / "templates" / "nested" / "b.txt").write_text("b\n")
+    (src / "templates" / "nested" / "c.txt").write_text("c\n")
+    reg.add(str(src), activate=True)
+
+    desc = load_desc("nested")
+    brs_cfg = {"repo": {}, "authors": {}, "hosts": {}, "settings": {}}
+    ctx = build_ctx(None, desc.id, {}, brs_cfg, tmpdir)
+    render(desc, ctx)
+
+    out = tmpdir / "out" / "sub"
+    assert (out / "a.txt").read_text() == "nested\n"
+    assert (out / "deeper" / "b.txt").read_text() == "b\n"
+    assert (out / "c.txt").read_text() == "c\n"
+
+
+def test_renderer_failure_leaves_no_empty_dirs_for_later_files(tmpdir):
+    src = tmpdir / "brs"
+    (src / "config").mkdir(parents=True)
+    (src / "templates" / "broken").mkdir(parents=True)
+    (src / "repo.yaml").write_text(
+        "id: demo-brs\nname: Demo\ndescription: d\nversion: 0.0.1\nmaintainer: T <t@e>\n"
+    )
+    (src / "templates" / "broken" / "template.config.yaml").write_text(
+        "id: broken\n"
+        "render:\n"
+        "  into: \"out/\"\n"
+        "  files:\n"
+        "    - bad.txt.j2 -> first/bad.txt\n"
+        "    - b.txt -> second/deeper/b.txt\n"
+    )
+    (src / "templates" / "broken" / "bad.txt.j2").write_text("{{ ctx.params.missing }}\n")
+    (src / "templates" / "broken" / "b.txt").write_text("b\n")
+    reg.add(str(src), activate=True)
+
+    desc = load_desc("broken")
+    brs_cfg = {"repo": {}, "authors": {}, "hosts": {}, "settings": {}}
+    ctx = build_ctx(None, desc.id, {}, brs_cfg, tmpdir)
+    with pytest.raises(UndefinedError):
+        render(desc, ctx)
+
+    assert not (tmpdir / "out" / "second").exists()
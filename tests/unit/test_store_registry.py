@@ -1,12 +1,10 @@
 import os
+import shutil
 from pathlib import Path
+import pytest
 from bpm.core import env, store_registry as reg
 
-def test_add_activate_remove_local(tmpdir, monkeypatch):
-    # isolate BPM_CACHE
-    cache = tmpdir / "cache"
-    monkeypatch.setenv("BPM_CACHE", str(cache))
-
+def test_add_activate_remove_local(tmpdir):
     # prepare local source BRS
     src = tmpdir / "brs_src"
     (src / "config").mkdir(parents=True)
@@ -37,4 +35,61 @@ def test_add_activate_remove_local(tmpdir, monkeypatch):
     # remove
     reg.remove("demo-brs")
     assert env.load_store_index().active is None
-    assert "demo-brs" not in env.load_store_index().stores
\ No newline at end of file
+    assert "demo-brs" not in env.load_store_index().stores
+
+def test_readd_replaces_cache_and_cleans_up(tmpdir):
+    src = tmpdir / "brs_src"
+    (src / "templates").mkdir(parents=True)
+    (src / "repo.yaml").write_text(
+        "id: demo-brs\nname: Demo BRS\ndescription: Minimal\nversion: 0.0.1\nmaintainer: Test <t@e>\n"
+    )
+    (src / "templates" / "old.txt").write_text("old")
+    reg.add(str(src))
+
+    (src / "templates" / "old.txt").unlink()
+    (src / "templates" / "new.txt").write_text("new")
+    rec = reg.add(str(src))
+
+    dest = Path(rec.cache_path)
+    assert (dest / "templates" / "new.txt").exists()
+    assert not (dest / "templates" / "old.txt").exists()
+    assert sorted(p.name for p in env.get_brs_cache_dir().iterdir()) == ["demo-brs"]
+
+
+def test_readd_failure_restores_previous_cache(tmpdir, monkeypatch):
+    src = tmpdir / "brs_src"
+    (src / "templates").mkdir(parents=True)
+    (src / "repo.yaml").write_text(
+        "id: demo-brs\nname: Demo BRS\ndescription: Minimal\nversion: 0.0.1\nmaintainer: Test <t@e>\n"
+    )
+    (src / "templates" / "old.txt").write_text("old")
+    rec = reg.add(str(src))
+
+    (src / "templates" / "new.txt").write_text("new")
+
+    def _fail(idx):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(env, "save_store_index", _fail)
+    with pytest.raises(OSError):
+        reg.add(str(src))
+
+    dest = Path(rec.cache_path)
+    assert (dest / "templates" / "old.txt").exists()
+    assert not (dest / "templates" / "new.txt").exists()
+    assert sorted(p.name for p in env.get_brs_cache_dir().iterdir()) == ["demo-brs"]
+
+
+def test_add_recreates_deleted_cache_root(tmpdir):
+    src = tmpdir / "brs_src"
+    src.mkdir()
+    (src / "repo.yaml").write_text(
+        "id: demo-brs\nname: Demo BRS\ndescription: Minimal\nversion: 0.0.1\nmaintainer: Test <t@e>\n"
+    )
+    reg.add(str(src), activate=True)
+
+    # a long-lived process keeps running after the cache is wiped
+    shutil.rmtree(env.get_cache_root())
+    rec = reg.add(str(src), activate=True)
+    assert Path(rec.cache_path).exists()
+    assert env.load_store_index().active == "demo-brs"
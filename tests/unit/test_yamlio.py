@@ -11,4 +11,19 @@ def test_yaml_atomic_overwrite(tmpdir):
     p = tmpdir / "b.yaml"
     safe_dump_yaml(p, {"a": 1})
     safe_dump_yaml(p, {"a": 2})
-    assert safe_load_yaml(p) == {"a": 2}
\ No newline at end of file
+    assert safe_load_yaml(p) == {"a": 2}
+
+def test_yaml_load_returns_independent_copies(tmpdir):
+    p = tmpdir / "c.yaml"
+    safe_dump_yaml(p, {"a": {"b": [1]}})
+    first = safe_load_yaml(p)
+    first["a"]["b"].append(2)
+    assert safe_load_yaml(p) == {"a": {"b": [1]}}
+
+
+def test_yaml_load_sees_external_edits(tmpdir):
+    p = tmpdir / "d.yaml"
+    p.write_text("a: 1\n")
+    assert safe_load_yaml(p) == {"a": 1}
+    p.write_text("a: 22\n")
+    assert safe_load_yaml(p) == {"a": 22}